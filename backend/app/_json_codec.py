@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Callable, Iterator, Mapping
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+JSONDecodeError = json.JSONDecodeError
+
+
+def json_dumps(value: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(value, ensure_ascii=False)
+
+
+def json_dumps_param(value: Any) -> bytes | str:
+    # Bind with CAST(? AS TEXT): orjson's UTF-8 bytes are stored as TEXT without a Python str round trip,
+    # and the stdlib fallback keeps its str as-is instead of paying for an extra encode copy.
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, ensure_ascii=False)
+
+
+def json_loads(value: str | bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(value)
+    return json.loads(value)
+
+
+class LazyJSONRow(Mapping[str, Any]):
+    """Read-only row mapping whose JSON columns are decoded on first access."""
+
+    __slots__ = ("_values", "_pending", "_loads")
+
+    def __init__(
+        self,
+        values: dict[str, Any],
+        pending: dict[str, tuple[str, Any]],
+        *,
+        loads: Callable[..., Any],
+    ) -> None:
+        self._values = values
+        self._pending = pending
+        self._loads = loads
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return self._values[key]
+        except KeyError:
+            raw, fallback = self._pending.pop(key)
+            value = self._loads(raw, fallback=fallback)
+            self._values[key] = value
+            return value
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._values or key in self._pending
+
+    def __iter__(self) -> Iterator[str]:
+        # Snapshot the keys: decoding moves entries from _pending into _values.
+        return iter((*self._values, *self._pending))
+
+    def __len__(self) -> int:
+        return len(self._values) + len(self._pending)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import atexit
+import queue
+import sqlite3
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from threading import Lock
+
+POOL_MAX_IDLE_CONNECTIONS = 8
+POOL_MAX_DATABASES = 8
+POOL_STATEMENT_CACHE_SIZE = 256
+
+CONNECTION_PRAGMAS: tuple[str, ...] = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA cache_size = -20000",
+    "PRAGMA busy_timeout = 5000",
+    "PRAGMA foreign_keys = ON",
+)
+
+CREATE_SCHEMA_VERSIONS_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS schema_versions (
+    component TEXT PRIMARY KEY,
+    version INTEGER NOT NULL
+)
+"""
+
+SchemaInitializer = Callable[[sqlite3.Connection], None]
+
+
+class SQLitePool:
+    def __init__(self, db_path: Path, *, max_idle: int = POOL_MAX_IDLE_CONNECTIONS) -> None:
+        self.db_path = db_path
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue(maxsize=max(1, max_idle))
+        self._closed = False
+        self._schema_ready: set[str] = set()
+        self._schema_lock = Lock()
+
+    def _open(self) -> sqlite3.Connection:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            cached_statements=POOL_STATEMENT_CACHE_SIZE,
+        )
+        conn.row_factory = sqlite3.Row
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def ensure_schema(self, conn: sqlite3.Connection, *, schema_key: str, ensure_schema: SchemaInitializer) -> None:
+        if schema_key in self._schema_ready:
+            return
+        with self._schema_lock:
+            if schema_key in self._schema_ready:
+                return
+            ensure_schema(conn)
+            conn.commit()
+            self._schema_ready.add(schema_key)
+
+    def acquire(self) -> sqlite3.Connection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return self._open()
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        if self._closed:
+            conn.close()
+            return
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def close(self) -> None:
+        self._closed = True
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+
+
+def read_schema_version(conn: sqlite3.Connection, component: str) -> int:
+    # Every store shares one database file, so versions are tracked per component
+    # instead of through the single PRAGMA user_version slot.
+    conn.execute(CREATE_SCHEMA_VERSIONS_TABLE_SQL)
+    row = conn.execute("SELECT version FROM schema_versions WHERE component = ?", (component,)).fetchone()
+    return int(row[0]) if row is not None else 0
+
+
+def write_schema_version(conn: sqlite3.Connection, component: str, version: int) -> None:
+    conn.execute(
+        """
+        INSERT INTO schema_versions (component, version) VALUES (?, ?)
+        ON CONFLICT(component) DO UPDATE SET version = excluded.version
+        """,
+        (component, int(version)),
+    )
+
+
+_POOLS: OrderedDict[str, SQLitePool] = OrderedDict()
+_POOLS_LOCK = Lock()
+
+
+def get_pool(db_path: Path) -> SQLitePool:
+    key = str(db_path)
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is not None:
+            _POOLS.move_to_end(key)
+            return pool
+
+        pool = SQLitePool(db_path)
+        _POOLS[key] = pool
+        while len(_POOLS) > POOL_MAX_DATABASES:
+            _, evicted = _POOLS.popitem(last=False)
+            evicted.close()
+        return pool
+
+
+@contextmanager
+def pooled_connection(
+    db_path: Path,
+    *,
+    schema_key: str,
+    ensure_schema: SchemaInitializer,
+) -> Iterator[sqlite3.Connection]:
+    pool = get_pool(db_path)
+    conn = pool.acquire()
+    try:
+        pool.ensure_schema(conn, schema_key=schema_key, ensure_schema=ensure_schema)
+        yield conn
+        if conn.in_transaction:
+            conn.commit()
+    except BaseException:
+        if conn.in_transaction:
+            conn.rollback()
+        raise
+    finally:
+        pool.release(conn)
+
+
+def close_all_pools() -> None:
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.close()
+
+
+atexit.register(close_all_pools)
@@ -1,12 +1,20 @@
 from __future__ import annotations
 
+import base64
 import hashlib
+import hmac
 import os
 import secrets
 import sqlite3
-from datetime import datetime, timedelta, timezone
+import time
+from collections import OrderedDict
+from contextlib import AbstractContextManager
+from functools import lru_cache
+from pathlib import Path
+from threading import Event, Lock
 from typing import Any
 
+from ._sqlite_pool import pooled_connection
 from .history_store import get_db_path
 
 CREATE_USERS_TABLE_SQL = """
@@ -25,10 +33,11 @@ CREATE_AUTH_SESSIONS_TABLE_SQL = """
 CREATE TABLE IF NOT EXISTS auth_sessions (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     user_id INTEGER NOT NULL,
-    token_hash TEXT NOT NULL UNIQUE,
+    token_hash BLOB NOT NULL UNIQUE,
     session_id TEXT NOT NULL,
     is_revoked INTEGER NOT NULL DEFAULT 0,
     expires_at TEXT NOT NULL,
+    expires_at_epoch INTEGER NOT NULL DEFAULT 0,
     created_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ', 'now')),
     updated_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ', 'now')),
     FOREIGN KEY(user_id) REFERENCES local_accounts(id)
@@ -45,16 +54,81 @@ CREATE_INDEX_SQLS = [
     ON auth_sessions (user_id, created_at DESC, id DESC);
     """,
     """
-    CREATE INDEX IF NOT EXISTS idx_auth_sessions_token_hash
-    ON auth_sessions (token_hash);
+    DROP INDEX IF EXISTS idx_auth_sessions_token_hash;
     """,
 ]
 
+AUTH_SESSIONS_OPTIONAL_COLUMNS: dict[str, str] = {
+    "expires_at_epoch": "INTEGER NOT NULL DEFAULT 0",
+}
+
+SELECT_LEGACY_TOKEN_HASHES_SQL = """
+SELECT id, token_hash
+FROM auth_sessions
+WHERE typeof(token_hash) = 'text'
+"""
+
+AUTH_TOKEN_BYTES = 36
+
+BACKFILL_EXPIRES_AT_EPOCH_SQL = """
+UPDATE auth_sessions
+SET expires_at_epoch = COALESCE(CAST(strftime('%s', expires_at) AS INTEGER), 0)
+WHERE expires_at_epoch = 0
+"""
+
+INSERT_AUTH_SESSION_SQL = """
+INSERT INTO auth_sessions (user_id, token_hash, session_id, is_revoked, expires_at, expires_at_epoch)
+VALUES (?, ?, ?, 0, ?, ?)
+"""
+
+REVOKE_AUTH_SESSION_BY_ID_SQL = """
+UPDATE auth_sessions
+SET is_revoked = 1,
+    updated_at = strftime('%Y-%m-%dT%H:%M:%fZ', 'now')
+WHERE id = ? AND is_revoked = 0
+"""
+
+REVOKE_AUTH_SESSION_BY_TOKEN_SQL = """
+UPDATE auth_sessions
+SET is_revoked = 1,
+    updated_at = strftime('%Y-%m-%dT%H:%M:%fZ', 'now')
+WHERE token_hash = ? AND is_revoked = 0
+"""
+
+REVOKE_AUTH_SESSION_BY_TOKEN_AND_SESSION_SQL = """
+UPDATE auth_sessions
+SET is_revoked = 1,
+    updated_at = strftime('%Y-%m-%dT%H:%M:%fZ', 'now')
+WHERE token_hash = ? AND session_id = ? AND is_revoked = 0
+"""
+
+SELECT_AUTH_SESSION_WITH_STATUS_SQL = """
+SELECT
+    s.id,
+    s.user_id,
+    s.session_id,
+    s.is_revoked,
+    s.expires_at,
+    s.expires_at_epoch,
+    s.expires_at_epoch <= :now_epoch AS is_expired,
+    u.username,
+    u.is_active
+FROM auth_sessions s
+JOIN local_accounts u ON u.id = s.user_id
+WHERE s.token_hash = :token_hash
+LIMIT 1
+"""
+
 
 VERIFY_REASON_NOT_FOUND = "NOT_FOUND"
 VERIFY_REASON_ACCOUNT_INACTIVE = "ACCOUNT_INACTIVE"
 VERIFY_REASON_INVALID_PASSWORD = "INVALID_PASSWORD"
 
+PASSWORD_HASH_ALGORITHM = "pbkdf2_sha512"
+PASSWORD_HASH_MIN_ITERATIONS = 120_000
+PASSWORD_HASH_TARGET_MS = 50
+LEGACY_PASSWORD_HASH_ITERATIONS = 120_000
+
 REFRESH_REASON_OK = "OK"
 REFRESH_REASON_TOKEN_REQUIRED = "TOKEN_REQUIRED"
 REFRESH_REASON_TOKEN_NOT_FOUND = "TOKEN_NOT_FOUND"
@@ -65,56 +139,142 @@ REFRESH_REASON_EXPIRED_TOO_LONG = "EXPIRED_TOO_LONG"
 REFRESH_REASON_EXPIRES_INVALID = "EXPIRES_INVALID"
 
 
-def _connect() -> sqlite3.Connection:
-    db_path = get_db_path()
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    return conn
+def _connect() -> AbstractContextManager[sqlite3.Connection]:
+    return pooled_connection(get_db_path(), schema_key="auth_store", ensure_schema=_ensure_schema)
+
+
+def _ensure_optional_columns(conn: sqlite3.Connection) -> None:
+    rows = conn.execute("PRAGMA table_info(auth_sessions)").fetchall()
+    existing = {str(row["name"]) for row in rows}
+    for column, ddl in AUTH_SESSIONS_OPTIONAL_COLUMNS.items():
+        if column in existing:
+            continue
+        conn.execute(f"ALTER TABLE auth_sessions ADD COLUMN {column} {ddl}")
+        if column == "expires_at_epoch":
+            conn.execute(BACKFILL_EXPIRES_AT_EPOCH_SQL)
+
+
+def _migrate_legacy_token_hashes(conn: sqlite3.Connection) -> None:
+    # Older rows stored the hex digest as TEXT; rewrite them as the raw 32-byte digest.
+    legacy = conn.execute(SELECT_LEGACY_TOKEN_HASHES_SQL).fetchall()
+    if not legacy:
+        return
+    conn.executemany(
+        "UPDATE auth_sessions SET token_hash = ? WHERE id = ?",
+        [(bytes.fromhex(str(row["token_hash"])), int(row["id"])) for row in legacy],
+    )
 
 
 def _ensure_schema(conn: sqlite3.Connection) -> None:
     conn.execute(CREATE_USERS_TABLE_SQL)
     conn.execute(CREATE_AUTH_SESSIONS_TABLE_SQL)
+    _ensure_optional_columns(conn)
+    _migrate_legacy_token_hashes(conn)
     for sql in CREATE_INDEX_SQLS:
         conn.execute(sql)
 
 
-def _utc_now() -> datetime:
-    return datetime.now(timezone.utc)
+def _format_epoch(ts: float) -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(ts)) + f".{int(ts % 1 * 1000):03d}Z"
 
 
-def _format_utc(dt: datetime) -> str:
-    return dt.astimezone(timezone.utc).isoformat()
+@lru_cache(maxsize=1)
+def _password_hash_iterations() -> int:
+    raw = os.getenv("CAREER_HERO_PASSWORD_HASH_ITERATIONS", "").strip()
+    if raw:
+        try:
+            return max(PASSWORD_HASH_MIN_ITERATIONS, int(raw))
+        except ValueError:
+            pass
 
+    sample_iterations = 10_000
+    started_at = time.perf_counter()
+    hashlib.pbkdf2_hmac("sha512", b"calibration", b"calibration-salt", sample_iterations)
+    elapsed_ms = max(0.001, (time.perf_counter() - started_at) * 1000)
+    calibrated = int(sample_iterations * PASSWORD_HASH_TARGET_MS / elapsed_ms)
+    return max(PASSWORD_HASH_MIN_ITERATIONS, calibrated - calibrated % 10_000)
 
-def _parse_utc(value: str) -> datetime | None:
-    raw = (value or "").strip()
-    if not raw:
-        return None
-    try:
-        if raw.endswith("Z"):
-            return datetime.fromisoformat(raw.replace("Z", "+00:00"))
-        return datetime.fromisoformat(raw)
-    except ValueError:
-        return None
 
-
-def _hash_password(*, password: str, salt: str) -> str:
+def _hash_password(*, password: str, salt: str, iterations: int | None = None) -> str:
+    safe_iterations = int(iterations or _password_hash_iterations())
     digest = hashlib.pbkdf2_hmac(
-        "sha256",
+        "sha512",
         password.encode("utf-8"),
         salt.encode("utf-8"),
-        120_000,
+        safe_iterations,
     )
-    return digest.hex()
+    return f"{PASSWORD_HASH_ALGORITHM}${safe_iterations}${digest.hex()}"
+
+
+def _verify_password(*, password: str, salt: str, encoded: str) -> tuple[bool, bool]:
+    algorithm, _, rest = encoded.partition("$")
+    if not rest:
+        legacy_digest = hashlib.pbkdf2_hmac(
+            "sha256",
+            password.encode("utf-8"),
+            salt.encode("utf-8"),
+            LEGACY_PASSWORD_HASH_ITERATIONS,
+        )
+        return secrets.compare_digest(encoded, legacy_digest.hex()), True
+
+    iterations_raw, _, _ = rest.partition("$")
+    if algorithm != PASSWORD_HASH_ALGORITHM or not iterations_raw.isdigit():
+        return False, False
+
+    iterations = int(iterations_raw)
+    actual = _hash_password(password=password, salt=salt, iterations=iterations)
+    if not secrets.compare_digest(encoded, actual):
+        return False, False
+    return True, iterations < _password_hash_iterations()
+
+
+class VerifiedPasswordCache:
+    def __init__(self, *, max_entries: int, ttl_seconds: int):
+        self.max_entries = max(1, int(max_entries))
+        self.ttl_seconds = max(1, int(ttl_seconds))
+        self._secret = secrets.token_bytes(32)
+        self._entries: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._lock = Lock()
+
+    def make_key(self, *, username: str, password: str) -> str:
+        return hmac.new(self._secret, f"{username}:{password}".encode("utf-8"), hashlib.sha256).hexdigest()
+
+    def matches(self, key: str, stored_hash: str) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False
+            cached_hash, expires_at = entry
+            if expires_at <= now:
+                self._entries.pop(key, None)
+                return False
+            self._entries.move_to_end(key)
+        return secrets.compare_digest(cached_hash, stored_hash)
 
+    def remember(self, key: str, stored_hash: str) -> None:
+        with self._lock:
+            self._entries[key] = (stored_hash, time.monotonic() + self.ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
 
-def _hash_token(token: str) -> str:
-    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+_VERIFIED_PASSWORDS = VerifiedPasswordCache(max_entries=1024, ttl_seconds=300)
+
+
+def _hash_token(token: str) -> bytes:
+    return hashlib.sha256(token.encode("utf-8")).digest()
+
+
+def _new_token() -> str:
+    return base64.urlsafe_b64encode(os.urandom(AUTH_TOKEN_BYTES)).decode("ascii")
 
 
 def _normalize_username(username: str) -> str:
+    # Most callers already send a trimmed lowercase name; str.strip returns the same object then.
+    if username.islower() and username.strip() is username:
+        return username
     return username.strip().lower()
 
 
@@ -130,37 +290,22 @@ def upsert_local_account(*, username: str, password: str) -> dict[str, Any]:
     password_hash = _hash_password(password=safe_password, salt=salt)
 
     with _connect() as conn:
-        _ensure_schema(conn)
-        existing = conn.execute(
+        rows = conn.execute(
             """
-            SELECT id FROM local_accounts WHERE username = ? LIMIT 1
+            INSERT INTO local_accounts (username, password_hash, password_salt, is_active)
+            VALUES (?, ?, ?, 1)
+            ON CONFLICT(username) DO UPDATE
+            SET password_hash = excluded.password_hash,
+                password_salt = excluded.password_salt,
+                is_active = 1,
+                updated_at = strftime('%Y-%m-%dT%H:%M:%fZ', 'now')
+            RETURNING id
             """,
-            (safe_username,),
-        ).fetchone()
-        if existing is None:
-            cursor = conn.execute(
-                """
-                INSERT INTO local_accounts (username, password_hash, password_salt, is_active)
-                VALUES (?, ?, ?, 1)
-                """,
-                (safe_username, password_hash, salt),
-            )
-            user_id = int(cursor.lastrowid)
-        else:
-            user_id = int(existing["id"])
-            conn.execute(
-                """
-                UPDATE local_accounts
-                SET password_hash = ?,
-                    password_salt = ?,
-                    is_active = 1,
-                    updated_at = strftime('%Y-%m-%dT%H:%M:%fZ', 'now')
-                WHERE id = ?
-                """,
-                (password_hash, salt, user_id),
-            )
+            (safe_username, password_hash, salt),
+        ).fetchall()
         conn.commit()
 
+    user_id = int(rows[0]["id"])
     return {"id": user_id, "username": safe_username}
 
 
@@ -169,7 +314,6 @@ def ensure_default_local_account() -> dict[str, Any]:
     default_password = os.getenv("CAREER_HERO_DEFAULT_PASSWORD", "demo123456").strip() or "demo123456"
 
     with _connect() as conn:
-        _ensure_schema(conn)
         row = conn.execute("SELECT id, username FROM local_accounts ORDER BY id ASC LIMIT 1").fetchone()
         if row is not None:
             return {"id": int(row["id"]), "username": str(row["username"])}
@@ -178,13 +322,21 @@ def ensure_default_local_account() -> dict[str, Any]:
 
 
 def verify_local_account_with_reason(*, username: str, password: str) -> tuple[dict[str, Any] | None, str | None]:
-    safe_username = _normalize_username(username)
-    safe_password = password.strip()
+    return verify_local_account_trusted_with_reason(username=username.strip(), password=password.strip())
+
+
+def verify_local_account_trusted_with_reason(
+    *,
+    username: str,
+    password: str,
+) -> tuple[dict[str, Any] | None, str | None]:
+    # Callers must pass already-trimmed credentials (e.g. AuthLoginRequest has validated them).
+    safe_username = username if username.islower() else username.lower()
+    safe_password = password
     if not safe_username or not safe_password:
         return None, VERIFY_REASON_NOT_FOUND
 
     with _connect() as conn:
-        _ensure_schema(conn)
         row = conn.execute(
             """
             SELECT id, username, password_hash, password_salt, is_active
@@ -201,12 +353,38 @@ def verify_local_account_with_reason(*, username: str, password: str) -> tuple[d
     if int(row["is_active"]) != 1:
         return None, VERIFY_REASON_ACCOUNT_INACTIVE
 
-    expected_hash = str(row["password_hash"])
-    actual_hash = _hash_password(password=safe_password, salt=str(row["password_salt"]))
-    if not secrets.compare_digest(expected_hash, actual_hash):
+    user = {"id": int(row["id"]), "username": str(row["username"])}
+    stored_hash = str(row["password_hash"])
+    cache_key = _VERIFIED_PASSWORDS.make_key(username=safe_username, password=safe_password)
+    if _VERIFIED_PASSWORDS.matches(cache_key, stored_hash):
+        return user, None
+
+    is_valid, needs_rehash = _verify_password(
+        password=safe_password,
+        salt=str(row["password_salt"]),
+        encoded=stored_hash,
+    )
+    if not is_valid:
         return None, VERIFY_REASON_INVALID_PASSWORD
 
-    return {"id": int(row["id"]), "username": str(row["username"])}, None
+    if needs_rehash:
+        new_salt = secrets.token_hex(16)
+        stored_hash = _hash_password(password=safe_password, salt=new_salt)
+        with _connect() as conn:
+            conn.execute(
+                """
+                UPDATE local_accounts
+                SET password_hash = ?,
+                    password_salt = ?,
+                    updated_at = strftime('%Y-%m-%dT%H:%M:%fZ', 'now')
+                WHERE id = ?
+                """,
+                (stored_hash, new_salt, int(row["id"])),
+            )
+            conn.commit()
+
+    _VERIFIED_PASSWORDS.remember(cache_key, stored_hash)
+    return user, None
 
 
 def verify_local_account(*, username: str, password: str) -> dict[str, Any] | None:
@@ -218,19 +396,16 @@ def create_auth_session(*, user_id: int, session_id: str, ttl_seconds: int = 7 *
     safe_user_id = int(user_id)
     safe_session_id = session_id.strip() or "anonymous"
     safe_ttl = max(300, int(ttl_seconds))
-    expires_at = _utc_now() + timedelta(seconds=safe_ttl)
+    expires_at = time.time() + safe_ttl
+    expires_at_text = _format_epoch(expires_at)
 
-    raw_token = secrets.token_urlsafe(48)
+    raw_token = _new_token()
     token_hash = _hash_token(raw_token)
 
     with _connect() as conn:
-        _ensure_schema(conn)
         conn.execute(
-            """
-            INSERT INTO auth_sessions (user_id, token_hash, session_id, is_revoked, expires_at)
-            VALUES (?, ?, ?, 0, ?)
-            """,
-            (safe_user_id, token_hash, safe_session_id, _format_utc(expires_at)),
+            INSERT_AUTH_SESSION_SQL,
+            (safe_user_id, token_hash, safe_session_id, expires_at_text, int(expires_at)),
         )
         conn.commit()
 
@@ -238,28 +413,20 @@ def create_auth_session(*, user_id: int, session_id: str, ttl_seconds: int = 7 *
         "token": raw_token,
         "token_hash": token_hash,
         "session_id": safe_session_id,
-        "expires_at": _format_utc(expires_at),
+        "expires_at": expires_at_text,
         "ttl_seconds": safe_ttl,
     }
 
 
-def _fetch_auth_session_by_token_hash(conn: sqlite3.Connection, token_hash: str) -> sqlite3.Row | None:
+def _fetch_auth_session_by_token_hash(
+    conn: sqlite3.Connection,
+    token_hash: bytes,
+    *,
+    now_epoch: int,
+) -> sqlite3.Row | None:
     return conn.execute(
-        """
-        SELECT
-            s.id,
-            s.user_id,
-            s.session_id,
-            s.is_revoked,
-            s.expires_at,
-            u.username,
-            u.is_active
-        FROM auth_sessions s
-        JOIN local_accounts u ON u.id = s.user_id
-        WHERE s.token_hash = ?
-        LIMIT 1
-        """,
-        (token_hash,),
+        SELECT_AUTH_SESSION_WITH_STATUS_SQL,
+        {"token_hash": token_hash, "now_epoch": now_epoch},
     ).fetchone()
 
 
@@ -270,8 +437,7 @@ def peek_auth_session(*, token: str) -> dict[str, Any] | None:
 
     token_hash = _hash_token(safe_token)
     with _connect() as conn:
-        _ensure_schema(conn)
-        row = _fetch_auth_session_by_token_hash(conn, token_hash)
+        row = _fetch_auth_session_by_token_hash(conn, token_hash, now_epoch=int(time.time()))
 
     if row is None:
         return None
@@ -294,23 +460,12 @@ def validate_auth_session(*, token: str, session_id: str | None = None) -> dict[
 
     token_hash = _hash_token(safe_token)
     with _connect() as conn:
-        _ensure_schema(conn)
-        row = _fetch_auth_session_by_token_hash(conn, token_hash)
+        row = _fetch_auth_session_by_token_hash(conn, token_hash, now_epoch=int(time.time()))
 
-    if row is None:
-        return None
-
-    if int(row["is_revoked"]) == 1:
-        return None
-
-    if int(row["is_active"]) != 1:
+    if row is None or row["is_revoked"] or row["is_expired"] or not row["is_active"]:
         return None
 
     expires_at_raw = str(row["expires_at"])
-    expires_at = _parse_utc(expires_at_raw)
-    if expires_at is None or expires_at <= _utc_now():
-        return None
-
     bound_session_id = str(row["session_id"])
     if session_id and bound_session_id != session_id:
         return None
@@ -324,6 +479,167 @@ def validate_auth_session(*, token: str, session_id: str | None = None) -> dict[
     }
 
 
+class _PendingRefresh:
+    __slots__ = ("db_path", "token_hash", "session_id", "ttl_seconds", "grace_seconds", "now", "result", "error", "done")
+
+    def __init__(
+        self,
+        *,
+        db_path: Path,
+        token_hash: bytes,
+        session_id: str | None,
+        ttl_seconds: int,
+        grace_seconds: int,
+        now: float,
+    ) -> None:
+        self.db_path = db_path
+        self.token_hash = token_hash
+        self.session_id = session_id
+        self.ttl_seconds = ttl_seconds
+        self.grace_seconds = grace_seconds
+        self.now = now
+        self.result: tuple[dict[str, Any] | None, str] | None = None
+        self.error: BaseException | None = None
+        self.done = Event()
+
+
+class RefreshGroupCommit:
+    """Coalesces concurrent refreshes so a burst shares one write transaction."""
+
+    def __init__(self, *, max_batch: int):
+        self.max_batch = max(1, int(max_batch))
+        self._pending: list[_PendingRefresh] = []
+        self._leader_active = False
+        self._lock = Lock()
+
+    def submit(self, item: _PendingRefresh) -> tuple[dict[str, Any] | None, str]:
+        with self._lock:
+            self._pending.append(item)
+            is_leader = not self._leader_active
+            self._leader_active = True
+
+        if is_leader:
+            self._drain()
+        else:
+            item.done.wait()
+
+        if item.error is not None:
+            raise item.error
+        if item.result is None:
+            raise RuntimeError("auth session refresh was not applied")
+        return item.result
+
+    def _drain(self) -> None:
+        while True:
+            with self._lock:
+                batch = self._pending[: self.max_batch]
+                del self._pending[: self.max_batch]
+                if not batch:
+                    self._leader_active = False
+                    return
+
+            by_db: dict[Path, list[_PendingRefresh]] = {}
+            for item in batch:
+                by_db.setdefault(item.db_path, []).append(item)
+
+            for db_path, items in by_db.items():
+                try:
+                    _apply_refresh_batch(db_path, items)
+                except BaseException as exc:
+                    for item in items:
+                        if item.result is None:
+                            item.error = exc
+                finally:
+                    for item in items:
+                        item.done.set()
+
+
+_REFRESH_GROUP_COMMIT = RefreshGroupCommit(max_batch=64)
+
+
+def _check_refresh_row(row: sqlite3.Row | None, item: _PendingRefresh) -> str:
+    if row is None:
+        return REFRESH_REASON_TOKEN_NOT_FOUND
+
+    if item.session_id and str(row["session_id"]) != item.session_id:
+        return REFRESH_REASON_SESSION_MISMATCH
+
+    if int(row["is_revoked"]) == 1:
+        return REFRESH_REASON_TOKEN_REVOKED
+
+    if int(row["is_active"]) != 1:
+        return REFRESH_REASON_USER_INACTIVE
+
+    old_expires_at_epoch = int(row["expires_at_epoch"] or 0)
+    if old_expires_at_epoch <= 0:
+        return REFRESH_REASON_EXPIRES_INVALID
+
+    if row["is_expired"] and int(item.now) - old_expires_at_epoch > item.grace_seconds:
+        return REFRESH_REASON_EXPIRED_TOO_LONG
+
+    return REFRESH_REASON_OK
+
+
+def _apply_refresh_batch(db_path: Path, items: list[_PendingRefresh]) -> None:
+    revoke_params: list[tuple[int]] = []
+    insert_params: list[tuple[int, str, str, str, int]] = []
+    claimed_ids: set[int] = set()
+    accepted: list[tuple[_PendingRefresh, dict[str, Any]]] = []
+
+    with pooled_connection(db_path, schema_key="auth_store", ensure_schema=_ensure_schema) as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        for item in items:
+            row = _fetch_auth_session_by_token_hash(conn, item.token_hash, now_epoch=int(item.now))
+            reason = _check_refresh_row(row, item)
+            if reason == REFRESH_REASON_OK and int(row["id"]) in claimed_ids:
+                # The same token was refreshed twice in this batch; only the first wins.
+                reason = REFRESH_REASON_TOKEN_REVOKED
+            if reason != REFRESH_REASON_OK:
+                item.result = (None, reason)
+                continue
+
+            claimed_ids.add(int(row["id"]))
+            new_token = _new_token()
+            new_token_hash = _hash_token(new_token)
+            new_expires_at = item.now + item.ttl_seconds
+            new_expires_at_text = _format_epoch(new_expires_at)
+            bound_session_id = str(row["session_id"])
+
+            revoke_params.append((int(row["id"]),))
+            insert_params.append(
+                (
+                    int(row["user_id"]),
+                    new_token_hash,
+                    bound_session_id,
+                    new_expires_at_text,
+                    int(new_expires_at),
+                )
+            )
+            accepted.append(
+                (
+                    item,
+                    {
+                        "token": new_token,
+                        "token_hash": new_token_hash,
+                        "session_id": bound_session_id,
+                        "user_id": int(row["user_id"]),
+                        "username": str(row["username"]),
+                        "expires_at": new_expires_at_text,
+                        "previous_expires_at": str(row["expires_at"]),
+                        "ttl_seconds": item.ttl_seconds,
+                    },
+                )
+            )
+
+        if revoke_params:
+            conn.executemany(REVOKE_AUTH_SESSION_BY_ID_SQL, revoke_params)
+            conn.executemany(INSERT_AUTH_SESSION_SQL, insert_params)
+        conn.commit()
+
+    for item, session in accepted:
+        item.result = (session, REFRESH_REASON_OK)
+
+
 def refresh_auth_session(
     *,
     token: str,
@@ -335,67 +651,16 @@ def refresh_auth_session(
     if not safe_token:
         return None, REFRESH_REASON_TOKEN_REQUIRED
 
-    safe_ttl = max(300, int(ttl_seconds))
-    safe_grace = max(0, int(grace_seconds))
-    now = _utc_now()
-
-    token_hash = _hash_token(safe_token)
-    with _connect() as conn:
-        _ensure_schema(conn)
-        row = _fetch_auth_session_by_token_hash(conn, token_hash)
-        if row is None:
-            return None, REFRESH_REASON_TOKEN_NOT_FOUND
-
-        bound_session_id = str(row["session_id"])
-        if session_id and bound_session_id != session_id:
-            return None, REFRESH_REASON_SESSION_MISMATCH
-
-        if int(row["is_revoked"]) == 1:
-            return None, REFRESH_REASON_TOKEN_REVOKED
-
-        if int(row["is_active"]) != 1:
-            return None, REFRESH_REASON_USER_INACTIVE
-
-        old_expires_at_raw = str(row["expires_at"])
-        old_expires_at = _parse_utc(old_expires_at_raw)
-        if old_expires_at is None:
-            return None, REFRESH_REASON_EXPIRES_INVALID
-
-        if old_expires_at <= now and (now - old_expires_at).total_seconds() > safe_grace:
-            return None, REFRESH_REASON_EXPIRED_TOO_LONG
-
-        new_token = secrets.token_urlsafe(48)
-        new_token_hash = _hash_token(new_token)
-        new_expires_at = now + timedelta(seconds=safe_ttl)
-
-        conn.execute(
-            """
-            UPDATE auth_sessions
-            SET is_revoked = 1,
-                updated_at = strftime('%Y-%m-%dT%H:%M:%fZ', 'now')
-            WHERE id = ? AND is_revoked = 0
-            """,
-            (int(row["id"]),),
-        )
-        conn.execute(
-            """
-            INSERT INTO auth_sessions (user_id, token_hash, session_id, is_revoked, expires_at)
-            VALUES (?, ?, ?, 0, ?)
-            """,
-            (int(row["user_id"]), new_token_hash, bound_session_id, _format_utc(new_expires_at)),
+    return _REFRESH_GROUP_COMMIT.submit(
+        _PendingRefresh(
+            db_path=get_db_path(),
+            token_hash=_hash_token(safe_token),
+            session_id=session_id,
+            ttl_seconds=max(300, int(ttl_seconds)),
+            grace_seconds=max(0, int(grace_seconds)),
+            now=time.time(),
         )
-        conn.commit()
-
-    return {
-        "token": new_token,
-        "token_hash": new_token_hash,
-        "session_id": bound_session_id,
-        "user_id": int(row["user_id"]),
-        "username": str(row["username"]),
-        "expires_at": _format_utc(new_expires_at),
-        "previous_expires_at": old_expires_at_raw,
-        "ttl_seconds": safe_ttl,
-    }, REFRESH_REASON_OK
+    )
 
 
 def revoke_auth_session(*, token: str, session_id: str | None = None) -> bool:
@@ -405,27 +670,13 @@ def revoke_auth_session(*, token: str, session_id: str | None = None) -> bool:
 
     token_hash = _hash_token(safe_token)
     with _connect() as conn:
-        _ensure_schema(conn)
         if session_id:
             affected = conn.execute(
-                """
-                UPDATE auth_sessions
-                SET is_revoked = 1,
-                    updated_at = strftime('%Y-%m-%dT%H:%M:%fZ', 'now')
-                WHERE token_hash = ? AND session_id = ? AND is_revoked = 0
-                """,
+                REVOKE_AUTH_SESSION_BY_TOKEN_AND_SESSION_SQL,
                 (token_hash, session_id),
             ).rowcount
         else:
-            affected = conn.execute(
-                """
-                UPDATE auth_sessions
-                SET is_revoked = 1,
-                    updated_at = strftime('%Y-%m-%dT%H:%M:%fZ', 'now')
-                WHERE token_hash = ? AND is_revoked = 0
-                """,
-                (token_hash,),
-            ).rowcount
+            affected = conn.execute(REVOKE_AUTH_SESSION_BY_TOKEN_SQL, (token_hash,)).rowcount
         conn.commit()
 
     return bool(affected)
@@ -433,7 +684,6 @@ def revoke_auth_session(*, token: str, session_id: str | None = None) -> bool:
 
 def revoke_user_sessions(*, user_id: int) -> int:
     with _connect() as conn:
-        _ensure_schema(conn)
         affected = conn.execute(
             """
             UPDATE auth_sessions
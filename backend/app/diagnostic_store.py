@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-import json
 import sqlite3
+from contextlib import AbstractContextManager
 from typing import Any
 
+from ._json_codec import JSONDecodeError, json_dumps, json_loads
+from ._sqlite_pool import pooled_connection
 from .history_store import get_db_path
 
 DIAGNOSTIC_STATES: tuple[str, ...] = (
@@ -15,15 +17,21 @@ DIAGNOSTIC_STATES: tuple[str, ...] = (
     "final_report",
 )
 
+_DIAGNOSTIC_STATES_SET: frozenset[str] = frozenset(DIAGNOSTIC_STATES)
+
 DEFAULT_DIAGNOSTIC_STATE = "jd_input"
 
-_ALLOWED_TRANSITIONS: dict[str, set[str]] = {
-    "jd_input": {"jd_input", "analyzing"},
-    "analyzing": {"analyzing", "report", "jd_input"},
-    "report": {"report", "analyzing", "micro", "chat", "final_report", "jd_input"},
-    "micro": {"micro", "chat", "final_report", "report", "analyzing"},
-    "chat": {"chat", "micro", "final_report", "report", "analyzing"},
-    "final_report": {"final_report", "report", "chat", "micro", "analyzing"},
+_ALLOWED_TRANSITIONS: dict[str, frozenset[str]] = {
+    "jd_input": frozenset({"jd_input", "analyzing"}),
+    "analyzing": frozenset({"analyzing", "report", "jd_input"}),
+    "report": frozenset({"report", "analyzing", "micro", "chat", "final_report", "jd_input"}),
+    "micro": frozenset({"micro", "chat", "final_report", "report", "analyzing"}),
+    "chat": frozenset({"chat", "micro", "final_report", "report", "analyzing"}),
+    "final_report": frozenset({"final_report", "report", "chat", "micro", "analyzing"}),
+}
+
+_ALLOWED_NEXT_SORTED: dict[str, tuple[str, ...]] = {
+    status: tuple(sorted(allowed)) for status, allowed in _ALLOWED_TRANSITIONS.items()
 }
 
 CREATE_TABLE_SQL = """
@@ -45,13 +53,44 @@ CREATE INDEX IF NOT EXISTS idx_diagnostic_flow_states_owner_resume
 ON diagnostic_flow_states (owner_scope_id, resume_id, updated_at DESC, id DESC);
 """
 
+STATE_COLUMNS_SQL = """
+    id,
+    owner_scope_id,
+    resume_id,
+    status,
+    last_event,
+    metadata_json,
+    created_at,
+    updated_at
+"""
+
+SELECT_STATE_BY_OWNER_RESUME_SQL = f"""
+SELECT {STATE_COLUMNS_SQL}
+FROM diagnostic_flow_states
+WHERE owner_scope_id = ? AND resume_id = ?
+LIMIT 1
+"""
+
+INSERT_DEFAULT_STATE_SQL = f"""
+INSERT INTO diagnostic_flow_states (owner_scope_id, resume_id, status, last_event, metadata_json)
+VALUES (?, ?, ?, 'init', '{{}}')
+ON CONFLICT(owner_scope_id, resume_id) DO UPDATE SET id = id
+RETURNING {STATE_COLUMNS_SQL}
+"""
+
+UPDATE_STATE_SQL = f"""
+UPDATE diagnostic_flow_states
+SET status = ?,
+    last_event = ?,
+    metadata_json = ?,
+    updated_at = strftime('%Y-%m-%dT%H:%M:%fZ', 'now')
+WHERE id = ?
+RETURNING {STATE_COLUMNS_SQL}
+"""
 
-def _connect() -> sqlite3.Connection:
-    db_path = get_db_path()
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    return conn
+
+def _connect() -> AbstractContextManager[sqlite3.Connection]:
+    return pooled_connection(get_db_path(), schema_key="diagnostic_store", ensure_schema=_ensure_schema)
 
 
 def _ensure_schema(conn: sqlite3.Connection) -> None:
@@ -60,7 +99,9 @@ def _ensure_schema(conn: sqlite3.Connection) -> None:
 
 
 def _safe_owner_scope(owner_scope_id: str | None) -> str:
-    value = (owner_scope_id or "").strip()
+    if not owner_scope_id:
+        return "anonymous"
+    value = owner_scope_id.strip()
     return value or "anonymous"
 
 
@@ -76,7 +117,7 @@ def _safe_resume_id(resume_id: int | None) -> int:
 
 def _safe_status(status: str | None) -> str:
     value = (status or "").strip().lower()
-    if value in DIAGNOSTIC_STATES:
+    if value in _DIAGNOSTIC_STATES_SET:
         return value
     return DEFAULT_DIAGNOSTIC_STATE
 
@@ -88,80 +129,51 @@ def _safe_event(event: str | None) -> str:
 
 def _json_loads(value: str, *, fallback: Any) -> Any:
     try:
-        return json.loads(value)
-    except json.JSONDecodeError:
+        return json_loads(value)
+    except JSONDecodeError:
         return fallback
 
 
-def _allowed_next(status: str) -> list[str]:
-    return sorted(_ALLOWED_TRANSITIONS.get(status, {status}))
+def _allowed_next(status: str) -> tuple[str, ...]:
+    allowed = _ALLOWED_NEXT_SORTED.get(status)
+    if allowed is None:
+        return (status,)
+    return allowed
 
 
-def _row_to_state(row: sqlite3.Row) -> dict[str, Any]:
-    status = _safe_status(str(row["status"]))
+def _row_to_state(row: sqlite3.Row | tuple[Any, ...]) -> dict[str, Any]:
+    # Positional unpack follows STATE_COLUMNS_SQL; every state query selects it verbatim.
+    state_id, owner_scope, resume_id, raw_status, last_event, metadata_json, created_at, updated_at = row
+    status = _safe_status(raw_status)
     return {
-        "id": int(row["id"]),
-        "owner_scope_id": str(row["owner_scope_id"]),
-        "resume_id": int(row["resume_id"]),
+        "id": state_id,
+        "owner_scope_id": owner_scope,
+        "resume_id": resume_id,
         "status": status,
-        "last_event": str(row["last_event"]),
-        "metadata": _json_loads(str(row["metadata_json"]), fallback={}),
+        "last_event": last_event,
+        "metadata": _json_loads(metadata_json, fallback={}),
         "allowed_next": _allowed_next(status),
-        "created_at": str(row["created_at"]),
-        "updated_at": str(row["updated_at"]),
+        "created_at": created_at,
+        "updated_at": updated_at,
     }
 
 
+def _get_or_create_state_row(conn: sqlite3.Connection, *, owner_scope_id: str, resume_id: int) -> sqlite3.Row | None:
+    row = conn.execute(SELECT_STATE_BY_OWNER_RESUME_SQL, (owner_scope_id, resume_id)).fetchone()
+    if row is not None:
+        return row
+
+    rows = conn.execute(INSERT_DEFAULT_STATE_SQL, (owner_scope_id, resume_id, DEFAULT_DIAGNOSTIC_STATE)).fetchall()
+    conn.commit()
+    return rows[0] if rows else None
+
+
 def get_diagnostic_state(*, owner_scope_id: str | None, resume_id: int | None = 0) -> dict[str, Any]:
     safe_owner = _safe_owner_scope(owner_scope_id)
     safe_resume = _safe_resume_id(resume_id)
 
     with _connect() as conn:
-        _ensure_schema(conn)
-        row = conn.execute(
-            """
-            SELECT
-                id,
-                owner_scope_id,
-                resume_id,
-                status,
-                last_event,
-                metadata_json,
-                created_at,
-                updated_at
-            FROM diagnostic_flow_states
-            WHERE owner_scope_id = ? AND resume_id = ?
-            LIMIT 1
-            """,
-            (safe_owner, safe_resume),
-        ).fetchone()
-
-        if row is None:
-            conn.execute(
-                """
-                INSERT INTO diagnostic_flow_states (owner_scope_id, resume_id, status, last_event, metadata_json)
-                VALUES (?, ?, ?, 'init', '{}')
-                """,
-                (safe_owner, safe_resume, DEFAULT_DIAGNOSTIC_STATE),
-            )
-            conn.commit()
-            row = conn.execute(
-                """
-                SELECT
-                    id,
-                    owner_scope_id,
-                    resume_id,
-                    status,
-                    last_event,
-                    metadata_json,
-                    created_at,
-                    updated_at
-                FROM diagnostic_flow_states
-                WHERE owner_scope_id = ? AND resume_id = ?
-                LIMIT 1
-                """,
-                (safe_owner, safe_resume),
-            ).fetchone()
+        row = _get_or_create_state_row(conn, owner_scope_id=safe_owner, resume_id=safe_resume)
 
     if row is None:
         raise RuntimeError("failed to initialize diagnostic flow state")
@@ -172,7 +184,9 @@ def get_diagnostic_state(*, owner_scope_id: str | None, resume_id: int | None =
 def can_transition_diagnostic_state(*, from_status: str, to_status: str) -> bool:
     current = _safe_status(from_status)
     target = _safe_status(to_status)
-    allowed = _ALLOWED_TRANSITIONS.get(current, {current})
+    allowed = _ALLOWED_TRANSITIONS.get(current)
+    if allowed is None:
+        return target == current
     return target in allowed
 
 
@@ -192,64 +206,13 @@ def transition_diagnostic_state(
     safe_metadata = metadata if isinstance(metadata, dict) else {}
 
     with _connect() as conn:
-        _ensure_schema(conn)
-
-        row = conn.execute(
-            """
-            SELECT
-                id,
-                owner_scope_id,
-                resume_id,
-                status,
-                last_event,
-                metadata_json,
-                created_at,
-                updated_at
-            FROM diagnostic_flow_states
-            WHERE owner_scope_id = ? AND resume_id = ?
-            LIMIT 1
-            """,
-            (safe_owner, safe_resume),
-        ).fetchone()
-
-        if row is None:
-            conn.execute(
-                """
-                INSERT INTO diagnostic_flow_states (owner_scope_id, resume_id, status, last_event, metadata_json)
-                VALUES (?, ?, ?, ?, ?)
-                """,
-                (
-                    safe_owner,
-                    safe_resume,
-                    DEFAULT_DIAGNOSTIC_STATE,
-                    "init",
-                    json.dumps({}, ensure_ascii=False),
-                ),
-            )
-            conn.commit()
-            row = conn.execute(
-                """
-                SELECT
-                    id,
-                    owner_scope_id,
-                    resume_id,
-                    status,
-                    last_event,
-                    metadata_json,
-                    created_at,
-                    updated_at
-                FROM diagnostic_flow_states
-                WHERE owner_scope_id = ? AND resume_id = ?
-                LIMIT 1
-                """,
-                (safe_owner, safe_resume),
-            ).fetchone()
+        row = _get_or_create_state_row(conn, owner_scope_id=safe_owner, resume_id=safe_resume)
 
         if row is None:
             raise RuntimeError("failed to initialize diagnostic flow state")
 
         current = _row_to_state(row)
-        current_status = _safe_status(str(current["status"]))
+        current_status = current["status"]
 
         if strict and not can_transition_diagnostic_state(from_status=current_status, to_status=target):
             raise ValueError(f"invalid diagnostic transition: {current_status} -> {target}")
@@ -258,42 +221,18 @@ def transition_diagnostic_state(
         if safe_metadata:
             merged_metadata = {**merged_metadata, **safe_metadata}
 
-        conn.execute(
-            """
-            UPDATE diagnostic_flow_states
-            SET status = ?,
-                last_event = ?,
-                metadata_json = ?,
-                updated_at = strftime('%Y-%m-%dT%H:%M:%fZ', 'now')
-            WHERE id = ?
-            """,
+        updated_rows = conn.execute(
+            UPDATE_STATE_SQL,
             (
                 target,
                 safe_event,
-                json.dumps(merged_metadata, ensure_ascii=False),
-                int(current["id"]),
+                json_dumps(merged_metadata),
+                current["id"],
             ),
-        )
+        ).fetchall()
         conn.commit()
 
-        updated = conn.execute(
-            """
-            SELECT
-                id,
-                owner_scope_id,
-                resume_id,
-                status,
-                last_event,
-                metadata_json,
-                created_at,
-                updated_at
-            FROM diagnostic_flow_states
-            WHERE id = ?
-            LIMIT 1
-            """,
-            (int(current["id"]),),
-        ).fetchone()
-
+    updated = updated_rows[0] if updated_rows else None
     if updated is None:
         raise RuntimeError("diagnostic flow state update lost")
 
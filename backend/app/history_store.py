@@ -1,12 +1,23 @@
 from __future__ import annotations
 
-import json
+import logging
 import os
+import queue
 import sqlite3
+import threading
+from collections.abc import Mapping, Sequence
+from contextlib import AbstractContextManager
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-DEFAULT_DB_PATH = Path(__file__).resolve().parents[1] / "data" / "career_hero.sqlite3"
+from ._json_codec import JSONDecodeError, LazyJSONRow, json_dumps_param, json_loads
+from ._sqlite_pool import pooled_connection, read_schema_version, write_schema_version
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+DEFAULT_DB_PATH = BACKEND_DIR / "data" / "career_hero.sqlite3"
 
 CREATE_TABLE_SQL = """
 CREATE TABLE IF NOT EXISTS analysis_history (
@@ -24,7 +35,8 @@ CREATE TABLE IF NOT EXISTS analysis_history (
     analysis_source TEXT NOT NULL DEFAULT 'rule',
     session_id TEXT NOT NULL DEFAULT 'anonymous',
     user_scope_id TEXT NOT NULL DEFAULT 'anonymous',
-    request_id TEXT NOT NULL
+    request_id TEXT NOT NULL,
+    canonical_scope_id TEXT GENERATED ALWAYS AS (CASE WHEN substr(user_scope_id, 1, 10) = 'anonymous:' AND length(user_scope_id) > 10 THEN 'session:' || substr(user_scope_id, 11) ELSE user_scope_id END) VIRTUAL
 );
 """
 
@@ -42,11 +54,17 @@ CREATE_INDEX_SQLS = [
     ON analysis_history (session_id, id DESC);
     """,
     """
-    CREATE INDEX IF NOT EXISTS idx_analysis_history_user_scope_id
-    ON analysis_history (user_scope_id, id DESC);
+    DROP INDEX IF EXISTS idx_analysis_history_user_scope_id;
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_analysis_history_canonical_scope
+    ON analysis_history (canonical_scope_id, id DESC, session_id, request_id);
     """,
 ]
 
+# Bump whenever CREATE_TABLE_SQL, OPTIONAL_COLUMNS or CREATE_INDEX_SQLS change.
+SCHEMA_VERSION = 2
+
 OPTIONAL_COLUMNS: dict[str, str] = {
     "suggestions_json": "TEXT NOT NULL DEFAULT '[]'",
     "optimized_resume_text": "TEXT NOT NULL DEFAULT ''",
@@ -54,36 +72,199 @@ OPTIONAL_COLUMNS: dict[str, str] = {
     "analysis_source": "TEXT NOT NULL DEFAULT 'rule'",
     "session_id": "TEXT NOT NULL DEFAULT 'anonymous'",
     "user_scope_id": "TEXT NOT NULL DEFAULT 'anonymous'",
+    "canonical_scope_id": "TEXT GENERATED ALWAYS AS (CASE WHEN substr(user_scope_id, 1, 10) = 'anonymous:' AND length(user_scope_id) > 10 THEN 'session:' || substr(user_scope_id, 11) ELSE user_scope_id END) VIRTUAL",
+}
+
+# Columns copied into result dicts as-is; sqlite3 already returns the declared types.
+HISTORY_SCALAR_COLUMNS: tuple[str, ...] = (
+    "id",
+    "created_at",
+    "resume_text_hash_or_excerpt",
+    "jd_excerpt",
+    "score",
+    "analysis_source",
+    "session_id",
+    "user_scope_id",
+    "request_id",
+)
+
+INSERT_ANALYSIS_HISTORY_SQL = """
+INSERT INTO analysis_history (
+    resume_text_hash_or_excerpt,
+    jd_excerpt,
+    score,
+    score_breakdown_json,
+    matched_keywords_json,
+    missing_keywords_json,
+    suggestions_json,
+    optimized_resume_text,
+    insights_json,
+    analysis_source,
+    session_id,
+    user_scope_id,
+    request_id
+)
+VALUES (
+    ?, ?, ?,
+    CAST(? AS TEXT), CAST(? AS TEXT), CAST(? AS TEXT), CAST(? AS TEXT),
+    ?,
+    CAST(? AS TEXT),
+    ?, ?, ?, ?
+)
+"""
+
+INSERT_ANALYSIS_HISTORY_FROM_JSON_SQL = """
+INSERT INTO analysis_history (
+    resume_text_hash_or_excerpt,
+    jd_excerpt,
+    score,
+    score_breakdown_json,
+    matched_keywords_json,
+    missing_keywords_json,
+    suggestions_json,
+    optimized_resume_text,
+    insights_json,
+    analysis_source,
+    session_id,
+    user_scope_id,
+    request_id
+)
+SELECT
+    json_extract(v.value, '$.resume_text_hash_or_excerpt'),
+    json_extract(v.value, '$.jd_excerpt'),
+    json_extract(v.value, '$.score'),
+    COALESCE(json_extract(v.value, '$.score_breakdown'), '{}'),
+    COALESCE(json_extract(v.value, '$.matched_keywords'), '[]'),
+    COALESCE(json_extract(v.value, '$.missing_keywords'), '[]'),
+    COALESCE(json_extract(v.value, '$.suggestions'), '[]'),
+    COALESCE(json_extract(v.value, '$.optimized_resume'), ''),
+    COALESCE(json_extract(v.value, '$.insights'), '{"summary":"","strengths":[],"risks":[]}'),
+    COALESCE(json_extract(v.value, '$.analysis_source'), 'rule'),
+    json_extract(v.value, '$.session_id'),
+    COALESCE(json_extract(v.value, '$.user_scope_id'), 'anonymous'),
+    json_extract(v.value, '$.request_id')
+FROM json_each(?) AS v
+"""
+
+SELECT_ANALYSIS_ITEM_SQL = """
+SELECT
+    id,
+    created_at,
+    resume_text_hash_or_excerpt,
+    jd_excerpt,
+    score,
+    score_breakdown_json,
+    matched_keywords_json,
+    missing_keywords_json,
+    suggestions_json,
+    optimized_resume_text,
+    insights_json,
+    analysis_source,
+    session_id,
+    user_scope_id,
+    request_id
+FROM analysis_history
+WHERE id = ?
+"""
+
+HISTORY_LIST_COLUMNS_SQL = """
+    id,
+    created_at,
+    resume_text_hash_or_excerpt,
+    jd_excerpt,
+    score,
+    score_breakdown_json,
+    matched_keywords_json,
+    missing_keywords_json,
+    analysis_source,
+    session_id,
+    user_scope_id,
+    request_id
+"""
+
+# _session_candidates yields at most two sessions, so every scope filter is one of these shapes.
+MAX_SESSION_CANDIDATES = 2
+
+
+def _scope_clause_sql(has_scope: bool, session_count: int) -> str:
+    clauses: list[str] = []
+    if has_scope:
+        clauses.append("canonical_scope_id = ?")
+    if session_count:
+        clauses.append(f"session_id IN ({', '.join(['?'] * session_count)})")
+    if not clauses:
+        return "1=1"
+    return f"({' OR '.join(clauses)})"
+
+
+def _filter_where_sql(has_request_id: bool, scope_shape: tuple[bool, int] | None) -> str:
+    clauses: list[str] = []
+    if has_request_id:
+        clauses.append("request_id = ?")
+    if scope_shape is not None:
+        clauses.append(SCOPE_CLAUSE_SQLS[scope_shape])
+    if not clauses:
+        return ""
+    return "WHERE " + " AND ".join(clauses)
+
+
+# Keyed by (has_scope, session_count); None means include_all_sessions.
+SCOPE_CLAUSE_SQLS: dict[tuple[bool, int], str] = {
+    (has_scope, session_count): _scope_clause_sql(has_scope, session_count)
+    for has_scope in (False, True)
+    for session_count in range(MAX_SESSION_CANDIDATES + 1)
+}
+
+_FILTER_SHAPES: tuple[tuple[bool, tuple[bool, int] | None], ...] = tuple(
+    (has_request_id, scope_shape)
+    for has_request_id in (False, True)
+    for scope_shape in (None, *SCOPE_CLAUSE_SQLS)
+)
+
+SELECT_ANALYSIS_HISTORY_SQLS: dict[tuple[bool, tuple[bool, int] | None], str] = {
+    shape: f"SELECT {HISTORY_LIST_COLUMNS_SQL} FROM analysis_history {_filter_where_sql(*shape)} ORDER BY id DESC LIMIT ?"
+    for shape in _FILTER_SHAPES
+}
+
+COUNT_ANALYSIS_HISTORY_SQLS: dict[tuple[bool, tuple[bool, int] | None], str] = {
+    shape: f"SELECT COUNT(*) AS c FROM analysis_history {_filter_where_sql(*shape)}" for shape in _FILTER_SHAPES
+}
+
+SELECT_ANALYSIS_ITEM_SQLS: dict[tuple[bool, int] | None, str] = {
+    None: f"{SELECT_ANALYSIS_ITEM_SQL} LIMIT 1",
+    **{shape: f"{SELECT_ANALYSIS_ITEM_SQL} AND {clause} LIMIT 1" for shape, clause in SCOPE_CLAUSE_SQLS.items()},
 }
 
 
 def get_db_path() -> Path:
-    configured_path = os.getenv("CAREER_HERO_DB_PATH", "").strip()
+    # Keyed on the raw env value so tests that repoint CAREER_HERO_DB_PATH still take effect.
+    return _resolve_db_path(os.environ.get("CAREER_HERO_DB_PATH", ""))
+
+
+@lru_cache(maxsize=8)
+def _resolve_db_path(raw_path: str) -> Path:
+    configured_path = raw_path.strip()
     if configured_path:
         path = Path(configured_path)
         if not path.is_absolute():
-            path = (Path(__file__).resolve().parents[1] / path).resolve()
+            path = (BACKEND_DIR / path).resolve()
         return path
     return DEFAULT_DB_PATH
 
 
-def _connect() -> sqlite3.Connection:
-    db_path = get_db_path()
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    return conn
+def _connect() -> AbstractContextManager[sqlite3.Connection]:
+    return pooled_connection(get_db_path(), schema_key="history_store", ensure_schema=_ensure_schema)
 
 
 def _json_loads(value: str, *, fallback: Any) -> Any:
     try:
-        return json.loads(value)
-    except json.JSONDecodeError:
+        return json_loads(value)
+    except JSONDecodeError:
         return fallback
 
 
 def _ensure_optional_columns(conn: sqlite3.Connection) -> None:
-    rows = conn.execute("PRAGMA table_info(analysis_history)").fetchall()
+    rows = conn.execute("PRAGMA table_xinfo(analysis_history)").fetchall()
     existing = {str(row["name"]) for row in rows}
     for column, ddl in OPTIONAL_COLUMNS.items():
         if column in existing:
@@ -92,35 +273,21 @@ def _ensure_optional_columns(conn: sqlite3.Connection) -> None:
 
 
 def _ensure_schema(conn: sqlite3.Connection) -> None:
+    if read_schema_version(conn, "history_store") >= SCHEMA_VERSION:
+        return
     conn.execute(CREATE_TABLE_SQL)
     _ensure_optional_columns(conn)
     for sql in CREATE_INDEX_SQLS:
         conn.execute(sql)
+    write_schema_version(conn, "history_store", SCHEMA_VERSION)
 
 
-def _scope_aliases(user_scope_id: str | None) -> list[str]:
+def _canonical_scope(user_scope_id: str | None) -> str:
+    # Must match the canonical_scope_id expression: anonymous:<sid> and session:<sid> are the same owner.
     safe_scope = (user_scope_id or "").strip()
-    if not safe_scope:
-        return []
-
-    result: list[str] = [safe_scope]
-    if safe_scope.startswith("session:"):
-        sid = safe_scope.split(":", 1)[1]
-        if sid:
-            result.append(f"anonymous:{sid}")
-    elif safe_scope.startswith("anonymous:"):
-        sid = safe_scope.split(":", 1)[1]
-        if sid:
-            result.append(f"session:{sid}")
-
-    dedup: list[str] = []
-    seen: set[str] = set()
-    for item in result:
-        if not item or item in seen:
-            continue
-        seen.add(item)
-        dedup.append(item)
-    return dedup
+    if safe_scope.startswith("anonymous:") and len(safe_scope) > 10:
+        return f"session:{safe_scope[10:]}"
+    return safe_scope
 
 
 def _session_candidates(*, session_id: str | None, user_scope_id: str | None) -> list[str]:
@@ -149,30 +316,25 @@ def _session_candidates(*, session_id: str | None, user_scope_id: str | None) ->
     return dedup
 
 
-def _build_scope_filter_clause(
+def _build_scope_filter(
     *,
     session_id: str | None,
     user_scope_id: str | None,
-) -> tuple[str, tuple[Any, ...]]:
-    clauses: list[str] = []
-    params: list[Any] = []
-
-    scopes = _scope_aliases(user_scope_id)
-    if scopes:
-        placeholders = ", ".join(["?"] * len(scopes))
-        clauses.append(f"user_scope_id IN ({placeholders})")
-        params.extend(scopes)
-
+) -> tuple[tuple[bool, int], tuple[Any, ...]]:
+    canonical_scope = _canonical_scope(user_scope_id)
     sessions = _session_candidates(session_id=session_id, user_scope_id=user_scope_id)
-    if sessions:
-        placeholders = ", ".join(["?"] * len(sessions))
-        clauses.append(f"session_id IN ({placeholders})")
-        params.extend(sessions)
+    if canonical_scope:
+        return (True, len(sessions)), (canonical_scope, *sessions)
+    return (False, len(sessions)), tuple(sessions)
 
-    if not clauses:
-        return "1=1", ()
 
-    return f"({' OR '.join(clauses)})", tuple(params)
+def _build_scope_filter_clause(
+    *,
+    session_id: str | None,
+    user_scope_id: str | None,
+) -> tuple[str, tuple[Any, ...]]:
+    shape, params = _build_scope_filter(session_id=session_id, user_scope_id=user_scope_id)
+    return SCOPE_CLAUSE_SQLS[shape], params
 
 
 def _build_filters(
@@ -181,26 +343,48 @@ def _build_filters(
     session_id: str | None,
     user_scope_id: str | None,
     include_all_sessions: bool,
-) -> tuple[str, tuple[Any, ...]]:
-    clauses: list[str] = []
-    params: list[Any] = []
+) -> tuple[tuple[bool, tuple[bool, int] | None], tuple[Any, ...]]:
+    scope_shape: tuple[bool, int] | None = None
+    params: tuple[Any, ...] = ()
+    if not include_all_sessions:
+        scope_shape, params = _build_scope_filter(session_id=session_id, user_scope_id=user_scope_id)
 
     if request_id:
-        clauses.append("request_id = ?")
-        params.append(request_id)
-
-    if not include_all_sessions:
-        scope_clause, scope_params = _build_scope_filter_clause(
-            session_id=session_id,
-            user_scope_id=user_scope_id,
-        )
-        clauses.append(scope_clause)
-        params.extend(scope_params)
+        return (True, scope_shape), (request_id, *params)
+    return (False, scope_shape), params
 
-    if not clauses:
-        return "", ()
 
-    return "WHERE " + " AND ".join(clauses), tuple(params)
+def _history_insert_params(
+    *,
+    resume_text_hash_or_excerpt: str,
+    jd_excerpt: str,
+    score: int,
+    score_breakdown: dict[str, int],
+    matched_keywords: list[str],
+    missing_keywords: list[str],
+    suggestions: list[str],
+    optimized_resume: str,
+    insights: dict[str, Any],
+    analysis_source: str,
+    session_id: str,
+    request_id: str,
+    user_scope_id: str = "anonymous",
+) -> tuple[Any, ...]:
+    return (
+        resume_text_hash_or_excerpt,
+        jd_excerpt,
+        score,
+        json_dumps_param(score_breakdown),
+        json_dumps_param(matched_keywords),
+        json_dumps_param(missing_keywords),
+        json_dumps_param(suggestions),
+        optimized_resume,
+        json_dumps_param(insights),
+        analysis_source,
+        session_id,
+        user_scope_id,
+        request_id,
+    )
 
 
 def insert_analysis_history(
@@ -219,45 +403,91 @@ def insert_analysis_history(
     request_id: str,
     user_scope_id: str = "anonymous",
 ) -> int:
+    params = _history_insert_params(
+        resume_text_hash_or_excerpt=resume_text_hash_or_excerpt,
+        jd_excerpt=jd_excerpt,
+        score=score,
+        score_breakdown=score_breakdown,
+        matched_keywords=matched_keywords,
+        missing_keywords=missing_keywords,
+        suggestions=suggestions,
+        optimized_resume=optimized_resume,
+        insights=insights,
+        analysis_source=analysis_source,
+        session_id=session_id,
+        request_id=request_id,
+        user_scope_id=user_scope_id,
+    )
+    with _connect() as conn:
+        cursor = conn.execute(INSERT_ANALYSIS_HISTORY_SQL, params)
+        conn.commit()
+        return int(cursor.lastrowid)
+
+
+def insert_analysis_history_many(rows: Sequence[dict[str, Any]]) -> int:
+    # Each row takes the same keyword arguments as insert_analysis_history.
+    params = [_history_insert_params(**row) for row in rows]
+    if not params:
+        return 0
+
+    with _connect() as conn:
+        conn.execute("BEGIN")
+        conn.executemany(INSERT_ANALYSIS_HISTORY_SQL, params)
+        conn.commit()
+    return len(params)
+
+
+def insert_analysis_history_batch_json(json_payload: str | bytes) -> int:
+    # json_payload is a JSON array of objects keyed like insert_analysis_history's arguments.
     with _connect() as conn:
-        _ensure_schema(conn)
-        cursor = conn.execute(
+        inserted = conn.execute(INSERT_ANALYSIS_HISTORY_FROM_JSON_SQL, (json_payload,)).rowcount
+        conn.commit()
+    return int(inserted or 0)
+
+
+def _delete_beyond_retention(
+    conn: sqlite3.Connection,
+    *,
+    keep_latest: int,
+    session_id: str | None,
+    user_scope_id: str | None,
+    include_all_sessions: bool,
+) -> int:
+    if keep_latest < 1:
+        keep_latest = 1
+
+    if not include_all_sessions and (user_scope_id or session_id):
+        clause, scope_params = _build_scope_filter_clause(
+            session_id=session_id,
+            user_scope_id=user_scope_id,
+        )
+        deleted = conn.execute(
+            f"""
+            DELETE FROM analysis_history
+            WHERE id IN (
+                SELECT id FROM (
+                    SELECT id, ROW_NUMBER() OVER (ORDER BY id DESC) AS rn
+                    FROM analysis_history
+                    WHERE {clause}
+                )
+                WHERE rn > ?
+            )
+            """,
+            (*scope_params, keep_latest),
+        ).rowcount
+    else:
+        deleted = conn.execute(
             """
-            INSERT INTO analysis_history (
-                resume_text_hash_or_excerpt,
-                jd_excerpt,
-                score,
-                score_breakdown_json,
-                matched_keywords_json,
-                missing_keywords_json,
-                suggestions_json,
-                optimized_resume_text,
-                insights_json,
-                analysis_source,
-                session_id,
-                user_scope_id,
-                request_id
+            DELETE FROM analysis_history
+            WHERE id <= (
+                SELECT id FROM analysis_history
+                ORDER BY id DESC
+                LIMIT 1 OFFSET ?
             )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
-            (
-                resume_text_hash_or_excerpt,
-                jd_excerpt,
-                score,
-                json.dumps(score_breakdown, ensure_ascii=False),
-                json.dumps(matched_keywords, ensure_ascii=False),
-                json.dumps(missing_keywords, ensure_ascii=False),
-                json.dumps(suggestions, ensure_ascii=False),
-                optimized_resume,
-                json.dumps(insights, ensure_ascii=False),
-                analysis_source,
-                session_id,
-                user_scope_id,
-                request_id,
-            ),
-        )
-        conn.commit()
-        return int(cursor.lastrowid)
+            (keep_latest,),
+        ).rowcount
+    return int(deleted or 0)
 
 
 def enforce_retention(
@@ -267,44 +497,90 @@ def enforce_retention(
     user_scope_id: str | None = None,
     include_all_sessions: bool = False,
 ) -> int:
-    if keep_latest < 1:
-        keep_latest = 1
-
     with _connect() as conn:
-        _ensure_schema(conn)
-        if not include_all_sessions and (user_scope_id or session_id):
-            clause, scope_params = _build_scope_filter_clause(
-                session_id=session_id,
-                user_scope_id=user_scope_id,
-            )
-            deleted = conn.execute(
-                f"""
-                DELETE FROM analysis_history
-                WHERE {clause}
-                  AND id NOT IN (
-                      SELECT id FROM analysis_history
-                      WHERE {clause}
-                      ORDER BY id DESC
-                      LIMIT ?
-                  )
-                """,
-                (*scope_params, *scope_params, keep_latest),
-            ).rowcount
-        else:
-            deleted = conn.execute(
-                """
-                DELETE FROM analysis_history
-                WHERE id NOT IN (
-                    SELECT id FROM analysis_history
-                    ORDER BY id DESC
-                    LIMIT ?
-                )
-                """,
-                (keep_latest,),
-            ).rowcount
+        deleted = _delete_beyond_retention(
+            conn,
+            keep_latest=keep_latest,
+            session_id=session_id,
+            user_scope_id=user_scope_id,
+            include_all_sessions=include_all_sessions,
+        )
         conn.commit()
 
-    return int(deleted or 0)
+    return deleted
+
+
+class RetentionQueue:
+    """Runs post-insert retention on a worker thread, coalescing jobs per scope into one transaction."""
+
+    def __init__(self, *, max_batch: int):
+        self.max_batch = max(1, int(max_batch))
+        self._jobs: queue.Queue[tuple[Path, str | None, str | None, int]] = queue.Queue()
+        self._worker: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def put(self, *, keep_latest: int, session_id: str | None, user_scope_id: str | None) -> None:
+        self._ensure_worker()
+        self._jobs.put((get_db_path(), session_id, user_scope_id, int(keep_latest)))
+
+    def join(self) -> None:
+        self._jobs.join()
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._lock:
+            if self._worker is not None and self._worker.is_alive():
+                return
+            self._worker = threading.Thread(target=self._run, name="history-retention", daemon=True)
+            self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._jobs.get()]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._jobs.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._apply(batch)
+            except Exception:
+                logger.exception("history retention batch failed")
+            finally:
+                for _ in batch:
+                    self._jobs.task_done()
+
+    def _apply(self, batch: list[tuple[Path, str | None, str | None, int]]) -> None:
+        by_db: dict[Path, dict[tuple[str | None, str | None], int]] = {}
+        for db_path, session_id, user_scope_id, keep_latest in batch:
+            scopes = by_db.setdefault(db_path, {})
+            key = (session_id, user_scope_id)
+            scopes[key] = min(keep_latest, scopes.get(key, keep_latest))
+
+        for db_path, scopes in by_db.items():
+            with pooled_connection(db_path, schema_key="history_store", ensure_schema=_ensure_schema) as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                for (session_id, user_scope_id), keep_latest in scopes.items():
+                    _delete_beyond_retention(
+                        conn,
+                        keep_latest=keep_latest,
+                        session_id=session_id,
+                        user_scope_id=user_scope_id,
+                        include_all_sessions=False,
+                    )
+                conn.commit()
+
+
+_RETENTION_QUEUE = RetentionQueue(max_batch=256)
+
+
+def schedule_retention(*, keep_latest: int, session_id: str | None, user_scope_id: str | None) -> None:
+    _RETENTION_QUEUE.put(keep_latest=keep_latest, session_id=session_id, user_scope_id=user_scope_id)
+
+
+def wait_for_pending_retention() -> None:
+    _RETENTION_QUEUE.join()
 
 
 def cleanup_history(
@@ -329,7 +605,6 @@ def delete_all_history(
     include_all_sessions: bool = False,
 ) -> int:
     with _connect() as conn:
-        _ensure_schema(conn)
         if not include_all_sessions and (user_scope_id or session_id):
             clause, scope_params = _build_scope_filter_clause(
                 session_id=session_id,
@@ -353,7 +628,7 @@ def fetch_analysis_history(
     user_scope_id: str | None = None,
     include_all_sessions: bool = False,
 ) -> list[dict[str, Any]]:
-    where_sql, params = _build_filters(
+    shape, params = _build_filters(
         request_id=request_id,
         session_id=session_id,
         user_scope_id=user_scope_id,
@@ -361,48 +636,15 @@ def fetch_analysis_history(
     )
 
     with _connect() as conn:
-        _ensure_schema(conn)
-        rows = conn.execute(
-            f"""
-            SELECT
-                id,
-                created_at,
-                resume_text_hash_or_excerpt,
-                jd_excerpt,
-                score,
-                score_breakdown_json,
-                matched_keywords_json,
-                missing_keywords_json,
-                analysis_source,
-                session_id,
-                user_scope_id,
-                request_id
-            FROM analysis_history
-            {where_sql}
-            ORDER BY id DESC
-            LIMIT ?
-            """,
-            (*params, limit),
-        ).fetchall()
+        rows = conn.execute(SELECT_ANALYSIS_HISTORY_SQLS[shape], (*params, limit)).fetchall()
 
     items: list[dict[str, Any]] = []
     for row in rows:
-        items.append(
-            {
-                "id": int(row["id"]),
-                "created_at": str(row["created_at"]),
-                "resume_text_hash_or_excerpt": str(row["resume_text_hash_or_excerpt"]),
-                "jd_excerpt": str(row["jd_excerpt"]),
-                "score": int(row["score"]),
-                "score_breakdown": _json_loads(str(row["score_breakdown_json"]), fallback={}),
-                "matched_keywords": _json_loads(str(row["matched_keywords_json"]), fallback=[]),
-                "missing_keywords": _json_loads(str(row["missing_keywords_json"]), fallback=[]),
-                "analysis_source": str(row["analysis_source"]),
-                "session_id": str(row["session_id"]),
-                "user_scope_id": str(row["user_scope_id"]),
-                "request_id": str(row["request_id"]),
-            }
-        )
+        item = {key: row[key] for key in HISTORY_SCALAR_COLUMNS}
+        item["score_breakdown"] = _json_loads(row["score_breakdown_json"], fallback={})
+        item["matched_keywords"] = _json_loads(row["matched_keywords_json"], fallback=[])
+        item["missing_keywords"] = _json_loads(row["missing_keywords_json"], fallback=[])
+        items.append(item)
     return items
 
 
@@ -412,64 +654,35 @@ def fetch_analysis_item(
     session_id: str | None = None,
     user_scope_id: str | None = None,
     include_all_sessions: bool = False,
-) -> dict[str, Any] | None:
-    with _connect() as conn:
-        _ensure_schema(conn)
-
-        query = """
-            SELECT
-                id,
-                created_at,
-                resume_text_hash_or_excerpt,
-                jd_excerpt,
-                score,
-                score_breakdown_json,
-                matched_keywords_json,
-                missing_keywords_json,
-                suggestions_json,
-                optimized_resume_text,
-                insights_json,
-                analysis_source,
-                session_id,
-                user_scope_id,
-                request_id
-            FROM analysis_history
-            WHERE id = ?
-        """
-        params: list[Any] = [history_id]
-
-        if not include_all_sessions:
-            clause, scope_params = _build_scope_filter_clause(
-                session_id=session_id,
-                user_scope_id=user_scope_id,
-            )
-            query += f" AND {clause}"
-            params.extend(scope_params)
-
-        query += " LIMIT 1"
+) -> Mapping[str, Any] | None:
+    scope_shape: tuple[bool, int] | None = None
+    params: tuple[Any, ...] = (history_id,)
+    if not include_all_sessions:
+        scope_shape, scope_params = _build_scope_filter(
+            session_id=session_id,
+            user_scope_id=user_scope_id,
+        )
+        params += scope_params
 
-        row = conn.execute(query, tuple(params)).fetchone()
+    with _connect() as conn:
+        row = conn.execute(SELECT_ANALYSIS_ITEM_SQLS[scope_shape], params).fetchone()
 
     if row is None:
         return None
 
-    return {
-        "id": int(row["id"]),
-        "created_at": str(row["created_at"]),
-        "resume_text_hash_or_excerpt": str(row["resume_text_hash_or_excerpt"]),
-        "jd_excerpt": str(row["jd_excerpt"]),
-        "score": int(row["score"]),
-        "score_breakdown": _json_loads(str(row["score_breakdown_json"]), fallback={}),
-        "matched_keywords": _json_loads(str(row["matched_keywords_json"]), fallback=[]),
-        "missing_keywords": _json_loads(str(row["missing_keywords_json"]), fallback=[]),
-        "suggestions": _json_loads(str(row["suggestions_json"]), fallback=[]),
-        "optimized_resume": str(row["optimized_resume_text"]),
-        "insights": _json_loads(str(row["insights_json"]), fallback={}),
-        "analysis_source": str(row["analysis_source"]),
-        "session_id": str(row["session_id"]),
-        "user_scope_id": str(row["user_scope_id"]),
-        "request_id": str(row["request_id"]),
-    }
+    values = {key: row[key] for key in HISTORY_SCALAR_COLUMNS}
+    values["optimized_resume"] = row["optimized_resume_text"]
+    return LazyJSONRow(
+        values,
+        {
+            "score_breakdown": (row["score_breakdown_json"], {}),
+            "matched_keywords": (row["matched_keywords_json"], []),
+            "missing_keywords": (row["missing_keywords_json"], []),
+            "suggestions": (row["suggestions_json"], []),
+            "insights": (row["insights_json"], {}),
+        },
+        loads=_json_loads,
+    )
 
 
 def get_history_total(
@@ -479,7 +692,7 @@ def get_history_total(
     user_scope_id: str | None = None,
     include_all_sessions: bool = False,
 ) -> int:
-    where_sql, params = _build_filters(
+    shape, params = _build_filters(
         request_id=request_id,
         session_id=session_id,
         user_scope_id=user_scope_id,
@@ -487,11 +700,7 @@ def get_history_total(
     )
 
     with _connect() as conn:
-        _ensure_schema(conn)
-        row = conn.execute(
-            f"SELECT COUNT(*) AS c FROM analysis_history {where_sql}",
-            params,
-        ).fetchone()
+        row = conn.execute(COUNT_ANALYSIS_HISTORY_SQLS[shape], params).fetchone()
 
     if row is None:
         return 0
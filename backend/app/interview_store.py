@@ -1,9 +1,13 @@
 from __future__ import annotations
 
-import json
 import sqlite3
+from collections.abc import Mapping
+from contextlib import AbstractContextManager
+from functools import lru_cache
 from typing import Any
 
+from ._json_codec import JSONDecodeError, LazyJSONRow, json_dumps_param, json_loads
+from ._sqlite_pool import pooled_connection, read_schema_version, write_schema_version
 from .history_store import get_db_path
 
 CREATE_TABLE_SQL = """
@@ -36,11 +40,17 @@ CREATE_INDEX_SQLS = [
     ON interview_sessions (status);
     """,
     """
-    CREATE INDEX IF NOT EXISTS idx_interview_sessions_owner
-    ON interview_sessions (session_owner_id, id DESC);
+    DROP INDEX IF EXISTS idx_interview_sessions_owner;
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS idx_interview_sessions_owner_status
+    ON interview_sessions (session_owner_id, status, updated_at DESC, id DESC);
     """,
 ]
 
+# Bump whenever CREATE_TABLE_SQL, OPTIONAL_COLUMNS or CREATE_INDEX_SQLS change.
+SCHEMA_VERSION = 1
+
 OPTIONAL_COLUMNS: dict[str, str] = {
     "session_owner_id": "TEXT NOT NULL DEFAULT 'anonymous'",
     "final_score": "INTEGER",
@@ -49,13 +59,75 @@ OPTIONAL_COLUMNS: dict[str, str] = {
 
 ALLOWED_STATUS = {"active", "paused", "finished"}
 
+# Columns copied into result dicts as-is; sqlite3 already returns the declared types.
+INTERVIEW_SCALAR_COLUMNS: tuple[str, ...] = (
+    "id",
+    "session_token",
+    "status",
+    "session_owner_id",
+    "current_index",
+    "final_score",
+    "created_at",
+    "updated_at",
+)
+
+INTERVIEW_COLUMNS_SQL = """
+    id,
+    session_token,
+    status,
+    session_owner_id,
+    jd_text,
+    resume_text,
+    questions_json,
+    answers_json,
+    current_index,
+    feedback_json,
+    final_score,
+    recommendations_json,
+    metadata_json,
+    created_at,
+    updated_at
+"""
+
+INTERVIEW_SUMMARY_COLUMNS_SQL = """
+    id,
+    session_token,
+    status,
+    session_owner_id,
+    current_index,
+    final_score,
+    recommendations_json,
+    CASE WHEN json_valid(questions_json) THEN json_array_length(questions_json) ELSE 0 END AS question_count,
+    CASE WHEN json_valid(answers_json) THEN json_array_length(answers_json) ELSE 0 END AS answered_count,
+    CASE WHEN json_valid(feedback_json) THEN json_extract(feedback_json, '$.summary') END AS feedback_summary,
+    created_at,
+    updated_at
+"""
+
+INSERT_INTERVIEW_SESSION_SQL = """
+INSERT INTO interview_sessions (
+    session_token,
+    status,
+    session_owner_id,
+    jd_text,
+    resume_text,
+    questions_json,
+    answers_json,
+    current_index,
+    metadata_json
+)
+VALUES (?, 'active', ?, ?, ?, CAST(? AS TEXT), '[]', 0, CAST(? AS TEXT))
+"""
+
+SELECT_INTERVIEW_SESSION_SQL = f"""
+SELECT {INTERVIEW_COLUMNS_SQL}
+FROM interview_sessions
+WHERE id = ?
+"""
+
 
-def _connect() -> sqlite3.Connection:
-    db_path = get_db_path()
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    return conn
+def _connect() -> AbstractContextManager[sqlite3.Connection]:
+    return pooled_connection(get_db_path(), schema_key="interview_store", ensure_schema=_ensure_schema)
 
 
 def _ensure_optional_columns(conn: sqlite3.Connection) -> None:
@@ -68,16 +140,19 @@ def _ensure_optional_columns(conn: sqlite3.Connection) -> None:
 
 
 def _ensure_schema(conn: sqlite3.Connection) -> None:
+    if read_schema_version(conn, "interview_store") >= SCHEMA_VERSION:
+        return
     conn.execute(CREATE_TABLE_SQL)
     _ensure_optional_columns(conn)
     for sql in CREATE_INDEX_SQLS:
         conn.execute(sql)
+    write_schema_version(conn, "interview_store", SCHEMA_VERSION)
 
 
 def _json_loads(value: str, *, fallback: Any) -> Any:
     try:
-        return json.loads(value)
-    except json.JSONDecodeError:
+        return json_loads(value)
+    except JSONDecodeError:
         return fallback
 
 
@@ -125,24 +200,42 @@ def _owner_filter_sql(*, session_owner_id: str | None, include_all_sessions: boo
     return f"AND session_owner_id IN ({placeholders})", tuple(candidates)
 
 
-def _row_to_item(row: sqlite3.Row) -> dict[str, Any]:
-    return {
-        "id": int(row["id"]),
-        "session_token": str(row["session_token"]),
-        "status": str(row["status"]),
-        "session_owner_id": str(row["session_owner_id"]),
-        "jd_text": str(row["jd_text"]),
-        "resume_text": str(row["resume_text"]),
-        "questions": _json_loads(str(row["questions_json"]), fallback=[]),
-        "answers": _json_loads(str(row["answers_json"]), fallback=[]),
-        "current_index": int(row["current_index"]),
-        "feedback": _json_loads(str(row["feedback_json"]), fallback={}) if row["feedback_json"] else None,
-        "final_score": int(row["final_score"]) if row["final_score"] is not None else None,
-        "recommendations": _json_loads(str(row["recommendations_json"]), fallback=[]),
-        "metadata": _json_loads(str(row["metadata_json"]), fallback={}),
-        "created_at": str(row["created_at"]),
-        "updated_at": str(row["updated_at"]),
+@lru_cache(maxsize=256)
+def _update_interview_session_sql(assignments: tuple[str, ...], scope_sql: str) -> str:
+    # Callers only ever pass a few field combinations, so the UPDATE text is built once per shape.
+    return f"""
+    UPDATE interview_sessions
+    SET {", ".join((*assignments, "updated_at = strftime('%Y-%m-%dT%H:%M:%fZ', 'now')"))}
+    WHERE id = ?
+    {scope_sql}
+    RETURNING {INTERVIEW_COLUMNS_SQL}
+    """
+
+
+def _row_to_item(row: sqlite3.Row) -> Mapping[str, Any]:
+    values: dict[str, Any] = {key: row[key] for key in INTERVIEW_SCALAR_COLUMNS}
+    values["jd_text"] = row["jd_text"]
+    values["resume_text"] = row["resume_text"]
+    pending: dict[str, tuple[str, Any]] = {
+        "questions": (row["questions_json"], []),
+        "answers": (row["answers_json"], []),
+        "recommendations": (row["recommendations_json"], []),
+        "metadata": (row["metadata_json"], {}),
     }
+    if row["feedback_json"]:
+        pending["feedback"] = (row["feedback_json"], {})
+    else:
+        values["feedback"] = None
+    return LazyJSONRow(values, pending, loads=_json_loads)
+
+
+def _row_to_summary(row: sqlite3.Row) -> dict[str, Any]:
+    item: dict[str, Any] = {key: row[key] for key in INTERVIEW_SCALAR_COLUMNS}
+    item["recommendations"] = _json_loads(row["recommendations_json"], fallback=[])
+    item["question_count"] = row["question_count"] or 0
+    item["answered_count"] = row["answered_count"] or 0
+    item["feedback_summary"] = row["feedback_summary"]
+    return item
 
 
 def create_interview_session(
@@ -155,29 +248,15 @@ def create_interview_session(
     metadata: dict[str, Any] | None = None,
 ) -> int:
     with _connect() as conn:
-        _ensure_schema(conn)
         cursor = conn.execute(
-            """
-            INSERT INTO interview_sessions (
-                session_token,
-                status,
-                session_owner_id,
-                jd_text,
-                resume_text,
-                questions_json,
-                answers_json,
-                current_index,
-                metadata_json
-            )
-            VALUES (?, 'active', ?, ?, ?, ?, '[]', 0, ?)
-            """,
+            INSERT_INTERVIEW_SESSION_SQL,
             (
                 session_token,
                 session_owner_id,
                 jd_text,
                 resume_text,
-                json.dumps(questions, ensure_ascii=False),
-                json.dumps(metadata or {}, ensure_ascii=False),
+                json_dumps_param(questions),
+                json_dumps_param(metadata or {}),
             ),
         )
         conn.commit()
@@ -189,38 +268,16 @@ def fetch_interview_session(
     session_id: int,
     session_owner_id: str | None = None,
     include_all_sessions: bool = False,
-) -> dict[str, Any] | None:
+) -> Mapping[str, Any] | None:
+    scope_sql, scope_params = _owner_filter_sql(
+        session_owner_id=session_owner_id,
+        include_all_sessions=include_all_sessions,
+    )
     with _connect() as conn:
-        _ensure_schema(conn)
-
-        scope_sql, scope_params = _owner_filter_sql(
-            session_owner_id=session_owner_id,
-            include_all_sessions=include_all_sessions,
-        )
-        query = f"""
-            SELECT
-                id,
-                session_token,
-                status,
-                session_owner_id,
-                jd_text,
-                resume_text,
-                questions_json,
-                answers_json,
-                current_index,
-                feedback_json,
-                final_score,
-                recommendations_json,
-                metadata_json,
-                created_at,
-                updated_at
-            FROM interview_sessions
-            WHERE id = ?
-            {scope_sql}
-            LIMIT 1
-        """
-
-        row = conn.execute(query, (session_id, *scope_params)).fetchone()
+        row = conn.execute(
+            f"{SELECT_INTERVIEW_SESSION_SQL} {scope_sql} LIMIT 1",
+            (session_id, *scope_params),
+        ).fetchone()
 
     if row is None:
         return None
@@ -228,13 +285,14 @@ def fetch_interview_session(
     return _row_to_item(row)
 
 
-def list_interview_sessions(
+def _list_interview_rows(
     *,
-    limit: int = 20,
-    status: str | None = None,
-    session_owner_id: str | None = None,
-    include_all_sessions: bool = False,
-) -> list[dict[str, Any]]:
+    columns_sql: str,
+    limit: int,
+    status: str | None,
+    session_owner_id: str | None,
+    include_all_sessions: bool,
+) -> list[sqlite3.Row]:
     safe_limit = max(1, min(100, int(limit)))
     safe_status = (status or "").strip().lower()
 
@@ -257,25 +315,9 @@ def list_interview_sessions(
         where_sql = "WHERE " + " AND ".join(where_clauses)
 
     with _connect() as conn:
-        _ensure_schema(conn)
-        rows = conn.execute(
+        return conn.execute(
             f"""
-            SELECT
-                id,
-                session_token,
-                status,
-                session_owner_id,
-                jd_text,
-                resume_text,
-                questions_json,
-                answers_json,
-                current_index,
-                feedback_json,
-                final_score,
-                recommendations_json,
-                metadata_json,
-                created_at,
-                updated_at
+            SELECT {columns_sql}
             FROM interview_sessions
             {where_sql}
             ORDER BY updated_at DESC, id DESC
@@ -284,15 +326,48 @@ def list_interview_sessions(
             (*params, safe_limit),
         ).fetchall()
 
+
+def list_interview_sessions(
+    *,
+    limit: int = 20,
+    status: str | None = None,
+    session_owner_id: str | None = None,
+    include_all_sessions: bool = False,
+) -> list[Mapping[str, Any]]:
+    rows = _list_interview_rows(
+        columns_sql=INTERVIEW_COLUMNS_SQL,
+        limit=limit,
+        status=status,
+        session_owner_id=session_owner_id,
+        include_all_sessions=include_all_sessions,
+    )
     return [_row_to_item(row) for row in rows]
 
 
-def list_interview_results(
+def list_interview_session_summaries(
     *,
     limit: int = 20,
+    status: str | None = None,
     session_owner_id: str | None = None,
     include_all_sessions: bool = False,
 ) -> list[dict[str, Any]]:
+    # List views only need counts and the feedback summary, so the text and JSON payloads stay in SQLite.
+    rows = _list_interview_rows(
+        columns_sql=INTERVIEW_SUMMARY_COLUMNS_SQL,
+        limit=limit,
+        status=status,
+        session_owner_id=session_owner_id,
+        include_all_sessions=include_all_sessions,
+    )
+    return [_row_to_summary(row) for row in rows]
+
+
+def list_interview_results(
+    *,
+    limit: int = 20,
+    session_owner_id: str | None = None,
+    include_all_sessions: bool = False,
+) -> list[Mapping[str, Any]]:
     return list_interview_sessions(
         limit=limit,
         status="finished",
@@ -306,7 +381,7 @@ def fetch_interview_result(
     session_id: int,
     session_owner_id: str | None = None,
     include_all_sessions: bool = False,
-) -> dict[str, Any] | None:
+) -> Mapping[str, Any] | None:
     row = fetch_interview_session(
         session_id=session_id,
         session_owner_id=session_owner_id,
@@ -331,56 +406,45 @@ def update_interview_session(
     metadata: dict[str, Any] | None = None,
     session_owner_id: str | None = None,
     include_all_sessions: bool = False,
-) -> dict[str, Any] | None:
-    current = fetch_interview_session(
-        session_id=session_id,
+) -> Mapping[str, Any] | None:
+    assignments: list[str] = []
+    params: list[Any] = []
+
+    safe_status = (status or "").strip().lower()
+    if safe_status in ALLOWED_STATUS:
+        assignments.append("status = ?")
+        params.append(safe_status)
+    if answers is not None:
+        assignments.append("answers_json = CAST(? AS TEXT)")
+        params.append(json_dumps_param(answers))
+    if current_index is not None:
+        assignments.append("current_index = ?")
+        params.append(int(current_index))
+    if feedback is not None:
+        assignments.append("feedback_json = CAST(? AS TEXT)")
+        params.append(json_dumps_param(feedback))
+    if final_score is not None:
+        assignments.append("final_score = ?")
+        params.append(int(final_score))
+    if recommendations is not None:
+        safe_recommendations = recommendations if isinstance(recommendations, list) else []
+        assignments.append("recommendations_json = CAST(? AS TEXT)")
+        params.append(json_dumps_param([str(item).strip() for item in safe_recommendations if str(item).strip()][:8]))
+    if metadata is not None:
+        assignments.append("metadata_json = CAST(? AS TEXT)")
+        params.append(json_dumps_param(metadata or {}))
+
+    scope_sql, scope_params = _owner_filter_sql(
         session_owner_id=session_owner_id,
         include_all_sessions=include_all_sessions,
     )
-    if current is None:
-        return None
-
-    safe_status = _normalize_status(status, fallback=str(current["status"]))
-    safe_answers = answers if answers is not None else current["answers"]
-    safe_current_index = int(current_index if current_index is not None else current["current_index"])
-    safe_feedback = feedback if feedback is not None else current["feedback"]
-    safe_final_score = int(final_score) if final_score is not None else current.get("final_score")
-    safe_recommendations = recommendations if recommendations is not None else current.get("recommendations", [])
-    if not isinstance(safe_recommendations, list):
-        safe_recommendations = []
-    safe_recommendations = [str(item).strip() for item in safe_recommendations if str(item).strip()][:8]
-    safe_metadata = metadata if metadata is not None else current["metadata"]
-
     with _connect() as conn:
-        _ensure_schema(conn)
-        conn.execute(
-            """
-            UPDATE interview_sessions
-            SET status = ?,
-                answers_json = ?,
-                current_index = ?,
-                feedback_json = ?,
-                final_score = ?,
-                recommendations_json = ?,
-                metadata_json = ?,
-                updated_at = strftime('%Y-%m-%dT%H:%M:%fZ', 'now')
-            WHERE id = ?
-            """,
-            (
-                safe_status,
-                json.dumps(safe_answers, ensure_ascii=False),
-                safe_current_index,
-                json.dumps(safe_feedback, ensure_ascii=False) if safe_feedback is not None else None,
-                safe_final_score,
-                json.dumps(safe_recommendations, ensure_ascii=False),
-                json.dumps(safe_metadata or {}, ensure_ascii=False),
-                session_id,
-            ),
-        )
+        rows = conn.execute(
+            _update_interview_session_sql(tuple(assignments), scope_sql),
+            (*params, session_id, *scope_params),
+        ).fetchall()
         conn.commit()
 
-    return fetch_interview_session(
-        session_id=session_id,
-        session_owner_id=session_owner_id,
-        include_all_sessions=include_all_sessions,
-    )
+    if not rows:
+        return None
+    return _row_to_item(rows[0])
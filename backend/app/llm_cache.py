@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from threading import Lock
+
+LLM_CACHE_DEFAULT_MAX_ENTRIES = 256
+LLM_CACHE_DEFAULT_TTL_SECONDS = 24 * 60 * 60
+
+
+def llm_cache_key(model: str, prompt: str) -> bytes:
+    # Digest instead of the raw prompt so cached keys do not pin full resume/JD texts in memory.
+    digest = hashlib.sha256(model.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(prompt.encode("utf-8"))
+    return digest.digest()
+
+
+class LLMResponseCache:
+    """Bounded in-memory LRU of raw LLM response texts with a per-entry TTL."""
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = LLM_CACHE_DEFAULT_MAX_ENTRIES,
+        ttl_seconds: int = LLM_CACHE_DEFAULT_TTL_SECONDS,
+    ) -> None:
+        self.max_entries = max(0, max_entries)
+        self.ttl_seconds = max(1, ttl_seconds)
+        self._entries: OrderedDict[bytes, tuple[float, str]] = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: bytes) -> str | None:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def set(self, key: bytes, value: str) -> None:
+        if not self.max_entries:
+            return
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"size": len(self._entries), "hits": self._hits, "misses": self._misses}
@@ -7,10 +7,15 @@ import os
 import re
 import time
 import uuid
-from collections import Counter, defaultdict, deque
+from array import array
+from collections import Counter, deque
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass, field as dataclass_field
 from datetime import datetime, timezone
+from functools import lru_cache
+from heapq import nsmallest
 from io import BytesIO
+from itertools import islice
 from threading import Lock
 from typing import Any, Literal
 
@@ -19,8 +24,9 @@ from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, Response
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator, model_validator
 
+from ._json_codec import JSONDecodeError, json_loads
 from .auth_store import (
     REFRESH_REASON_EXPIRED_TOO_LONG,
     REFRESH_REASON_SESSION_MISMATCH,
@@ -35,16 +41,16 @@ from .auth_store import (
     refresh_auth_session,
     revoke_auth_session,
     validate_auth_session,
-    verify_local_account_with_reason,
+    verify_local_account_trusted_with_reason,
 )
 from .history_store import (
     cleanup_history,
     delete_all_history,
-    enforce_retention,
     fetch_analysis_history,
     fetch_analysis_item,
     get_history_total,
     insert_analysis_history,
+    schedule_retention,
 )
 from .diagnostic_store import (
     DIAGNOSTIC_STATES,
@@ -56,10 +62,10 @@ from .interview_store import (
     create_interview_session,
     fetch_interview_result,
     fetch_interview_session,
-    list_interview_results,
-    list_interview_sessions,
+    list_interview_session_summaries,
     update_interview_session,
 )
+from .llm_cache import LLMResponseCache, llm_cache_key
 from .rag_retriever import get_rag_retriever_mode, search_knowledge_with_configured_retriever
 from .rag_store import (
     create_knowledge_item,
@@ -107,8 +113,8 @@ def get_auth_mode() -> Literal["local", "token"]:
     return "local"
 
 
-def is_public_path(path: str) -> bool:
-    if path in {
+PUBLIC_PATHS = frozenset(
+    {
         "/health",
         "/openapi.json",
         "/docs",
@@ -116,9 +122,21 @@ def is_public_path(path: str) -> bool:
         "/redoc",
         "/api/auth/login",
         "/api/auth/refresh",
-    }:
-        return True
-    return path.startswith("/health/")
+    }
+)
+PUBLIC_PATH_PREFIX = "/health/"
+AUTH_API_PREFIX = "/api/auth/"
+PROTECTED_PATH_PREFIXES = (
+    "/api/resumes",
+    "/api/history",
+    "/api/interview",
+    "/api/rag",
+    "/api/diagnostic",
+)
+
+
+def is_public_path(path: str) -> bool:
+    return path in PUBLIC_PATHS or path.startswith(PUBLIC_PATH_PREFIX)
 
 
 def is_protected_resource_login_required() -> bool:
@@ -132,62 +150,63 @@ def is_login_required_path(path: str) -> bool:
     if is_public_path(path):
         return False
 
-    if path.startswith("/api/auth/"):
+    if path.startswith(AUTH_API_PREFIX):
         return False
 
-    protected_prefixes = (
-        "/api/resumes",
-        "/api/history",
-        "/api/interview",
-        "/api/rag",
-        "/api/diagnostic",
-    )
-    return path.startswith(protected_prefixes)
+    return path.startswith(PROTECTED_PATH_PREFIXES)
 
 
 def get_expected_api_token() -> str:
     return os.getenv("CAREER_HERO_API_TOKEN", "").strip()
 
 
-def parse_request_token(request: Request) -> str:
-    header_value = request.headers.get("x-api-token", "").strip()
-    if header_value:
-        return header_value
+@dataclass(frozen=True, slots=True)
+class RequestCredentials:
+    api_token: str
+    bearer_token: str
+    session_token: str
 
-    auth_header = request.headers.get("authorization", "").strip()
-    if auth_header.lower().startswith("bearer "):
-        return auth_header[7:].strip()
-    return ""
 
+def get_request_credentials(request: Request) -> RequestCredentials:
+    cached = getattr(request.state, "credentials", None)
+    if cached is not None:
+        return cached
+
+    headers = request.headers
+    auth_header = headers.get("authorization", "").strip()
+    bearer_token = auth_header[7:].strip() if auth_header[:7].lower() == "bearer " else ""
+    # The cookie jar is only parsed when no x-session-token header was sent.
+    session_token = headers.get("x-session-token", "").strip() or request.cookies.get("career_hero_auth", "").strip()
+    credentials = RequestCredentials(
+        api_token=headers.get("x-api-token", "").strip(),
+        bearer_token=bearer_token,
+        session_token=session_token,
+    )
+    request.state.credentials = credentials
+    return credentials
 
-def parse_auth_session_token(request: Request) -> str:
-    header_token = request.headers.get("x-session-token", "").strip()
-    if header_token:
-        return header_token
 
-    cookie_token = request.cookies.get("career_hero_auth", "").strip()
-    if cookie_token:
-        return cookie_token
+def parse_request_token(request: Request) -> str:
+    credentials = get_request_credentials(request)
+    return credentials.api_token or credentials.bearer_token
+
 
-    return ""
+def parse_auth_session_token(request: Request) -> str:
+    return get_request_credentials(request).session_token
 
 
 def parse_auth_session_token_for_auth_api(request: Request) -> str:
-    token = parse_auth_session_token(request)
-    if token:
-        return token
+    credentials = get_request_credentials(request)
+    return credentials.session_token or credentials.bearer_token
 
-    auth_header = request.headers.get("authorization", "").strip()
-    if auth_header.lower().startswith("bearer "):
-        return auth_header[7:].strip()
 
-    return ""
+SESSION_ID_PATTERN = re.compile(r"[A-Za-z0-9][A-Za-z0-9._:-]{2,127}")
 
 
 def validate_session_id(session_id: str) -> bool:
     if not session_id:
         return False
-    return bool(re.fullmatch(r"[A-Za-z0-9][A-Za-z0-9._:-]{2,127}", session_id))
+    return SESSION_ID_PATTERN.fullmatch(session_id) is not None
 
 
 def is_cross_session_access_allowed() -> bool:
@@ -199,6 +218,9 @@ def is_session_isolation_enabled() -> bool:
 
 
 MAX_TEXT_LENGTH = 20_000
+# Per-text memo for tokenize/line/quality helpers; bounded so MAX_TEXT_LENGTH inputs cannot grow RSS unchecked.
+TEXT_ARTIFACT_CACHE_SIZE = 256
+PDF_EXPORT_CACHE_SIZE = 128
 MAX_JSON_BODY_BYTES = get_env_int("CAREER_HERO_MAX_JSON_BYTES", 80_000, min_value=2_048)
 DEFAULT_HISTORY_LIMIT = 20
 MAX_HISTORY_LIMIT = 100
@@ -226,7 +248,7 @@ ERROR_CODE_BY_STATUS = {
     500: "INTERNAL_ERROR",
 }
 
-STOPWORDS = {
+STOPWORDS = frozenset({
     "the",
     "and",
     "or",
@@ -278,16 +300,27 @@ STOPWORDS = {
     "工作",
     "岗位",
     "要求",
-}
+})
 
-SUSPICIOUS_PATTERNS = [
-    re.compile(r"<\s*script", re.IGNORECASE),
-    re.compile(r"javascript\s*:", re.IGNORECASE),
-    re.compile(r"ignore\s+all\s+previous\s+instructions", re.IGNORECASE),
-]
-EMAIL_PATTERN = re.compile(r"[A-Z0-9._%+-]+@[A-Z0-9.-]+\.[A-Z]{2,}", re.IGNORECASE)
-PHONE_PATTERN = re.compile(r"(?:\+?\d{1,3}[\s-]?)?(?:\d[\s-]?){6,15}\d")
-VAGUE_MARKERS = {
+SUSPICIOUS_PATTERN = re.compile(
+    r"<\s*script|javascript\s*:|ignore\s+all\s+previous\s+instructions",
+    re.IGNORECASE,
+)
+NUL_STRIP_TABLE = str.maketrans("", "", "\x00")
+# The local part starts at a run boundary and never gives characters back: '@' is outside its class, so
+# backtracking could not produce a match anyway, and without this a long '@'-free run is scanned quadratically.
+EMAIL_PATTERN = re.compile(r"(?<![A-Z0-9._%+-])[A-Z0-9._%+-]++@[A-Z0-9.-]+\.[A-Z]{2,}", re.IGNORECASE)
+PHONE_PATTERN = re.compile(r"(?:\+?\d{1,3}[\s-]?)?(?>\d[\s-]?){6,15}\d")
+TOKEN_PATTERN = re.compile(r"[a-zA-Z0-9+#.]{2,}|[\u4e00-\u9fff]{2,}")
+DIGIT_PATTERN = re.compile(r"\d")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+SENTENCE_SPLIT_PATTERN = re.compile(r"[。！？.!?\n]+")
+SENTENCE_END_SPLIT_PATTERN = re.compile(r"[。！？.!?]+")
+SKILL_SPLIT_PATTERN = re.compile(r"[,，、/|；;\s]+")
+NAME_LINE_EXCLUDE_PATTERN = re.compile(r"[:：@]")
+CODE_FENCE_OPEN_PATTERN = re.compile(r"^```(?:json)?")
+CODE_FENCE_CLOSE_PATTERN = re.compile(r"```$")
+VAGUE_MARKERS = frozenset({
     "负责",
     "参与",
     "协助",
@@ -299,8 +332,8 @@ VAGUE_MARKERS = {
     "responsible",
     "assist",
     "support",
-}
-ACTION_MARKERS = {
+})
+ACTION_MARKERS = frozenset({
     "设计",
     "搭建",
     "优化",
@@ -313,6 +346,21 @@ ACTION_MARKERS = {
     "optimized",
     "delivered",
     "led",
+})
+
+
+def _compile_marker_pattern(markers: Iterable[str]) -> re.Pattern[str]:
+    # Substring semantics, same as `marker in text.lower()`; longest first so overlaps resolve consistently.
+    return re.compile("|".join(re.escape(marker) for marker in sorted(markers, key=len, reverse=True)), re.IGNORECASE)
+
+
+VAGUE_MARKER_PATTERN = _compile_marker_pattern(VAGUE_MARKERS)
+ACTION_MARKER_PATTERN = _compile_marker_pattern(ACTION_MARKERS)
+# Checked in order; the first section whose marker appears in a line wins.
+RESUME_SECTION_PATTERNS = {
+    "skills": _compile_marker_pattern(("skills", "skill", "技能", "技术栈", "能力", "擅长")),
+    "experience": _compile_marker_pattern(("experience", "工作经历", "项目经历", "经历")),
+    "education": _compile_marker_pattern(("education", "教育", "学历")),
 }
 
 DEFAULT_RAG_TOP_K = get_env_int("CAREER_HERO_RAG_TOP_K", 5, min_value=1, max_value=20)
@@ -321,6 +369,12 @@ logging.basicConfig(level=logging.INFO, format="%(message)s")
 logger = logging.getLogger("career_hero.api")
 
 
+class ResponseModel(BaseModel):
+    """Server-built payload; frozen because responses are never mutated after construction."""
+
+    model_config = ConfigDict(frozen=True)
+
+
 class AnalyzeRequest(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
@@ -340,13 +394,12 @@ class AnalyzeRequest(BaseModel):
         if not value or not value.strip():
             raise ValueError("text cannot be blank")
 
-        normalized = re.sub(r"\u0000", "", value).strip()
+        normalized = value.translate(NUL_STRIP_TABLE).strip()
         if not normalized:
             raise ValueError("text cannot be blank")
 
-        for pattern in SUSPICIOUS_PATTERNS:
-            if pattern.search(normalized):
-                raise ValueError("text contains blocked pattern")
+        if SUSPICIOUS_PATTERN.search(normalized):
+            raise ValueError("text contains blocked pattern")
 
         return normalized
 
@@ -359,39 +412,39 @@ class AnalyzeRequest(BaseModel):
         return self
 
 
-class ScoreBreakdown(BaseModel):
+class ScoreBreakdown(ResponseModel):
     keyword_match: int
     coverage: int
     writing_quality_stub: int
 
 
-class AnalysisInsights(BaseModel):
+class AnalysisInsights(ResponseModel):
     summary: str
     strengths: list[str]
     risks: list[str]
 
 
-class DiagnosticBreakdown(BaseModel):
+class DiagnosticBreakdown(ResponseModel):
     keywordCoverage: int
     quantifiedImpact: int
     expressionClarity: int
     jdRelevance: int
 
 
-class IssueClassification(BaseModel):
+class IssueClassification(ResponseModel):
     type: Literal["模糊描述", "缺量化", "关键词缺失"]
     severity: Literal["low", "medium", "high"]
     evidence: list[str]
     recommendation: str
 
 
-class PipAdviceItem(BaseModel):
+class PipAdviceItem(ResponseModel):
     finding: str
     improvement: str
     practice: str
 
 
-class RagHit(BaseModel):
+class RagHit(ResponseModel):
     id: int
     title: str
     snippet: str
@@ -401,14 +454,14 @@ class RagHit(BaseModel):
     matchedTerms: list[str] = Field(default_factory=list)
 
 
-class DiagnosticFlowState(BaseModel):
+class DiagnosticFlowState(ResponseModel):
     resumeId: int
     status: Literal["jd_input", "analyzing", "report", "micro", "chat", "final_report"]
     allowedNext: list[Literal["jd_input", "analyzing", "report", "micro", "chat", "final_report"]] = Field(default_factory=list)
     updatedAt: str
 
 
-class AnalyzeResponse(BaseModel):
+class AnalyzeResponse(ResponseModel):
     score: int
     matchedKeywords: list[str]
     missingKeywords: list[str]
@@ -429,7 +482,7 @@ class AnalyzeResponse(BaseModel):
     diagnosticState: DiagnosticFlowState
 
 
-class DiagnosticStateResponse(BaseModel):
+class DiagnosticStateResponse(ResponseModel):
     requestId: str
     state: DiagnosticFlowState
 
@@ -452,12 +505,12 @@ class DiagnosticTransitionRequest(BaseModel):
         return normalized
 
 
-class KeywordSummary(BaseModel):
+class KeywordSummary(ResponseModel):
     matched: list[str]
     missing: list[str]
 
 
-class HistoryItem(BaseModel):
+class HistoryItem(ResponseModel):
     id: int
     createdAt: str
     resumeTextHashOrExcerpt: str
@@ -469,13 +522,13 @@ class HistoryItem(BaseModel):
     requestId: str
 
 
-class HistoryResponse(BaseModel):
+class HistoryResponse(ResponseModel):
     requestId: str
     total: int
     items: list[HistoryItem]
 
 
-class HistoryDetail(BaseModel):
+class HistoryDetail(ResponseModel):
     id: int
     createdAt: str
     resumeTextHashOrExcerpt: str
@@ -492,7 +545,7 @@ class HistoryDetail(BaseModel):
     requestId: str
 
 
-class HistoryDetailResponse(BaseModel):
+class HistoryDetailResponse(ResponseModel):
     requestId: str
     item: HistoryDetail
 
@@ -505,7 +558,7 @@ class HistoryCleanupRequest(BaseModel):
     confirmText: str | None = None
 
 
-class HistoryCleanupResponse(BaseModel):
+class HistoryCleanupResponse(ResponseModel):
     requestId: str
     deleted: int
     total: int
@@ -559,7 +612,7 @@ class ResumeUpdateRequest(BaseModel):
         return normalized
 
 
-class ResumeVersionItem(BaseModel):
+class ResumeVersionItem(ResponseModel):
     id: int
     versionNo: int
     content: str
@@ -570,7 +623,7 @@ class ResumeVersionItem(BaseModel):
     createdAt: str
 
 
-class ResumeItem(BaseModel):
+class ResumeItem(ResponseModel):
     id: int
     title: str
     latestVersionNo: int
@@ -581,7 +634,7 @@ class ResumeItem(BaseModel):
     latestContentPreview: str
 
 
-class ResumeDetail(BaseModel):
+class ResumeDetail(ResponseModel):
     id: int
     title: str
     latestVersionNo: int
@@ -592,18 +645,18 @@ class ResumeDetail(BaseModel):
     versions: list[ResumeVersionItem]
 
 
-class ResumeListResponse(BaseModel):
+class ResumeListResponse(ResponseModel):
     requestId: str
     total: int
     items: list[ResumeItem]
 
 
-class ResumeDetailResponse(BaseModel):
+class ResumeDetailResponse(ResponseModel):
     requestId: str
     item: ResumeDetail
 
 
-class ResumeDeleteResponse(BaseModel):
+class ResumeDeleteResponse(ResponseModel):
     requestId: str
     deleted: bool
 
@@ -623,30 +676,30 @@ class AuthLoginRequest(BaseModel):
         return normalized
 
 
-class AuthUser(BaseModel):
+class AuthUser(ResponseModel):
     id: int
     username: str
 
 
-class AuthContextSession(BaseModel):
+class AuthContextSession(ResponseModel):
     id: str
     scope: str
 
 
-class AuthContextExpiry(BaseModel):
+class AuthContextExpiry(ResponseModel):
     expiresAt: str | None
     ttlSeconds: int | None
     isExpired: bool
 
 
-class AuthContext(BaseModel):
+class AuthContext(ResponseModel):
     mode: Literal["local", "token"]
     user: AuthUser | None
     session: AuthContextSession
     expiry: AuthContextExpiry
 
 
-class AuthLoginResponse(BaseModel):
+class AuthLoginResponse(ResponseModel):
     requestId: str
     sessionId: str
     user: AuthUser
@@ -654,7 +707,7 @@ class AuthLoginResponse(BaseModel):
     expiresAt: str
 
 
-class AuthRefreshResponse(BaseModel):
+class AuthRefreshResponse(ResponseModel):
     requestId: str
     sessionId: str
     user: AuthUser
@@ -663,7 +716,7 @@ class AuthRefreshResponse(BaseModel):
     previousExpiresAt: str
 
 
-class AuthMeResponse(BaseModel):
+class AuthMeResponse(ResponseModel):
     requestId: str
     sessionId: str
     user: AuthUser
@@ -671,11 +724,23 @@ class AuthMeResponse(BaseModel):
     authContext: AuthContext
 
 
-class AuthLogoutResponse(BaseModel):
+class AuthLogoutResponse(ResponseModel):
     requestId: str
     revoked: bool
 
 
+def normalize_tag_list(value: list[str]) -> list[str]:
+    # Keyed by lowercase tag so the first spelling wins; stops once the 20-tag cap is reached.
+    tags: dict[str, str] = {}
+    for item in value:
+        tag = item.strip()
+        if tag:
+            tags.setdefault(tag.lower(), tag[:40])
+            if len(tags) == 20:
+                break
+    return list(tags.values())
+
+
 class KnowledgeCreateRequest(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
@@ -695,18 +760,7 @@ class KnowledgeCreateRequest(BaseModel):
     @field_validator("tags")
     @classmethod
     def normalize_tags(cls, value: list[str]) -> list[str]:
-        normalized: list[str] = []
-        seen: set[str] = set()
-        for item in value:
-            tag = item.strip()
-            if not tag:
-                continue
-            marker = tag.lower()
-            if marker in seen:
-                continue
-            seen.add(marker)
-            normalized.append(tag[:40])
-        return normalized[:20]
+        return normalize_tag_list(value)
 
 
 class KnowledgeUpdateRequest(BaseModel):
@@ -732,32 +786,21 @@ class KnowledgeUpdateRequest(BaseModel):
     def normalize_optional_tags(cls, value: list[str] | None) -> list[str] | None:
         if value is None:
             return None
-        normalized: list[str] = []
-        seen: set[str] = set()
-        for item in value:
-            tag = item.strip()
-            if not tag:
-                continue
-            marker = tag.lower()
-            if marker in seen:
-                continue
-            seen.add(marker)
-            normalized.append(tag[:40])
-        return normalized[:20]
+        return normalize_tag_list(value)
 
 
-class KnowledgeDeleteResponse(BaseModel):
+class KnowledgeDeleteResponse(ResponseModel):
     requestId: str
     deleted: bool
 
 
-class RagSearchConfig(BaseModel):
+class RagSearchConfig(ResponseModel):
     topK: int
     threshold: float
     updatedAt: str
 
 
-class RagSearchConfigResponse(BaseModel):
+class RagSearchConfigResponse(ResponseModel):
     requestId: str
     config: RagSearchConfig
 
@@ -769,7 +812,7 @@ class RagSearchConfigUpdateRequest(BaseModel):
     threshold: float | None = Field(default=None, ge=0.0, le=1.0)
 
 
-class KnowledgeItem(BaseModel):
+class KnowledgeItem(ResponseModel):
     id: int
     title: str
     content: str
@@ -783,12 +826,12 @@ class KnowledgeItem(BaseModel):
     updatedByScope: str
 
 
-class KnowledgeItemResponse(BaseModel):
+class KnowledgeItemResponse(ResponseModel):
     requestId: str
     item: KnowledgeItem
 
 
-class KnowledgeListResponse(BaseModel):
+class KnowledgeListResponse(ResponseModel):
     requestId: str
     total: int
     items: list[KnowledgeItem]
@@ -808,7 +851,7 @@ class InterviewCreateRequest(BaseModel):
     def normalize_interview_text(cls, value: str | None) -> str | None:
         if value is None:
             return None
-        normalized = re.sub(r"\u0000", "", value).strip()
+        normalized = value.translate(NUL_STRIP_TABLE).strip()
         if not normalized:
             raise ValueError("text cannot be blank")
         return normalized
@@ -820,14 +863,14 @@ class InterviewCreateRequest(BaseModel):
         return self
 
 
-class InterviewQuestion(BaseModel):
+class InterviewQuestion(ResponseModel):
     index: int
     category: str
     question: str
     focus: str
 
 
-class InterviewSession(BaseModel):
+class InterviewSession(ResponseModel):
     id: int
     sessionToken: str
     status: Literal["active", "paused", "finished"]
@@ -841,40 +884,40 @@ class InterviewSession(BaseModel):
     updatedAt: str
 
 
-class InterviewCreateResponse(BaseModel):
+class InterviewCreateResponse(ResponseModel):
     requestId: str
     session: InterviewSession
     nextQuestion: InterviewQuestion | None
     degraded: bool = False
 
 
-class InterviewNextResponse(BaseModel):
+class InterviewNextResponse(ResponseModel):
     requestId: str
     session: InterviewSession
     nextQuestion: InterviewQuestion | None
     degraded: bool = False
 
 
-class InterviewSessionListResponse(BaseModel):
+class InterviewSessionListResponse(ResponseModel):
     requestId: str
     total: int
     items: list[InterviewSession]
 
 
-class InterviewSessionDetailResponse(BaseModel):
+class InterviewSessionDetailResponse(ResponseModel):
     requestId: str
     session: InterviewSession
     nextQuestion: InterviewQuestion | None
     feedbackDraft: InterviewFeedbackDraft | None = None
 
 
-class InterviewResultListResponse(BaseModel):
+class InterviewResultListResponse(ResponseModel):
     requestId: str
     total: int
     items: list[InterviewSession]
 
 
-class InterviewResultDetailResponse(BaseModel):
+class InterviewResultDetailResponse(ResponseModel):
     requestId: str
     session: InterviewSession
     feedbackDraft: InterviewFeedbackDraft | None = None
@@ -895,21 +938,21 @@ class InterviewAnswerRequest(BaseModel):
         return normalized
 
 
-class InterviewAnswerEvaluation(BaseModel):
+class InterviewAnswerEvaluation(ResponseModel):
     answerScore: int
     strengths: list[str]
     improvements: list[str]
     followUpQuestion: str | None = None
 
 
-class InterviewAnswerResponse(BaseModel):
+class InterviewAnswerResponse(ResponseModel):
     requestId: str
     session: InterviewSession
     evaluation: InterviewAnswerEvaluation
     nextQuestion: InterviewQuestion | None
 
 
-class InterviewFeedbackDraft(BaseModel):
+class InterviewFeedbackDraft(ResponseModel):
     overallScore: int
     dimensionScores: dict[str, int]
     strengths: list[str]
@@ -918,13 +961,13 @@ class InterviewFeedbackDraft(BaseModel):
     summary: str
 
 
-class InterviewFinishResponse(BaseModel):
+class InterviewFinishResponse(ResponseModel):
     requestId: str
     session: InterviewSession
     feedbackDraft: InterviewFeedbackDraft
 
 
-@dataclass
+@dataclass(slots=True)
 class RateLimitDecision:
     allowed: bool
     remaining: int
@@ -932,26 +975,61 @@ class RateLimitDecision:
     message: str | None = None
 
 
+RATE_LIMIT_SWEEP_INTERVAL = 1024
+RATE_LIMIT_SWEEP_BATCH = 32
+
+
+class StaleKeySweeper:
+    """Amortized cleanup for limiter maps whose keys are otherwise only pruned when probed again."""
+
+    __slots__ = ("_ops", "_cursor")
+
+    def __init__(self) -> None:
+        self._ops = 0
+        self._cursor = 0
+
+    def due(self) -> bool:
+        # Checked before the caller builds its staleness predicate, so the common path allocates nothing.
+        self._ops += 1
+        if self._ops < RATE_LIMIT_SWEEP_INTERVAL:
+            return False
+        self._ops = 0
+        return True
+
+    def sweep(self, entries: dict[Any, Any], is_stale: Callable[[Any], bool]) -> None:
+        batch = list(islice(entries.items(), self._cursor, self._cursor + RATE_LIMIT_SWEEP_BATCH))
+        stale_keys = [key for key, value in batch if is_stale(value)]
+        for key in stale_keys:
+            del entries[key]
+        self._cursor += len(batch) - len(stale_keys)
+        if self._cursor >= len(entries):
+            self._cursor = 0
+
+
 class AuthLoginRateLimiter:
     def __init__(self, *, fail_limit: int, window_seconds: int, lock_seconds: int):
         self.fail_limit = max(2, int(fail_limit))
         self.window_seconds = max(10, int(window_seconds))
         self.lock_seconds = max(10, int(lock_seconds))
-        self._failures: dict[str, deque[float]] = defaultdict(deque)
+        # Only the newest fail_limit failures can trigger a lock, so each key keeps a bounded ring.
+        self._failures: dict[str, deque[float]] = {}
         self._blocked_until: dict[str, float] = {}
+        self._failures_sweeper = StaleKeySweeper()
+        self._blocked_sweeper = StaleKeySweeper()
         self._lock = Lock()
 
     def _cleanup(self, key: str, now: float) -> deque[float]:
-        queue = self._failures[key]
+        queue = self._failures.get(key)
+        if queue is None:
+            return deque()
         while queue and now - queue[0] > self.window_seconds:
             queue.popleft()
         if not queue:
-            self._failures.pop(key, None)
-            return deque()
+            del self._failures[key]
         return queue
 
     def check(self, *, key: str) -> RateLimitDecision:
-        now = time.time()
+        now = time.monotonic()
         with self._lock:
             blocked_until = float(self._blocked_until.get(key, 0.0))
             if blocked_until > now:
@@ -977,13 +1055,17 @@ class AuthLoginRateLimiter:
             )
 
     def register_failure(self, *, key: str) -> RateLimitDecision:
-        now = time.time()
+        now = time.monotonic()
         with self._lock:
-            queue = self._cleanup(key, now)
-            if not queue:
-                queue = self._failures[key]
-
+            self._cleanup(key, now)
+            queue = self._failures.get(key)
+            if queue is None:
+                queue = self._failures[key] = deque(maxlen=self.fail_limit)
             queue.append(now)
+            if self._failures_sweeper.due():
+                self._failures_sweeper.sweep(self._failures, lambda failures: now - failures[-1] > self.window_seconds)
+            if self._blocked_sweeper.due():
+                self._blocked_sweeper.sweep(self._blocked_until, lambda blocked_until: blocked_until <= now)
             if len(queue) >= self.fail_limit:
                 blocked_until = now + self.lock_seconds
                 self._blocked_until[key] = blocked_until
@@ -1007,25 +1089,51 @@ class AuthLoginRateLimiter:
             self._blocked_until.pop(key, None)
 
 
+@dataclass(slots=True)
+class _SessionRateState:
+    hits: deque[float]
+    duplicates: dict[str, deque[float]] = dataclass_field(default_factory=dict)
+
+
 class SessionRateLimiter:
     def __init__(self, *, limit: int, window_seconds: int, duplicate_limit: int, duplicate_window_seconds: int):
         self.limit = max(1, limit)
         self.window_seconds = max(1, window_seconds)
         self.duplicate_limit = max(2, duplicate_limit)
         self.duplicate_window_seconds = max(1, duplicate_window_seconds)
-        self._hits: dict[str, deque[float]] = defaultdict(deque)
-        self._duplicates: dict[tuple[str, str], deque[float]] = defaultdict(deque)
+        # Read once: the override is deployment config, not something to re-probe inside the lock per request.
+        self.hard_limit_enabled = self.limit <= 10 or get_env_bool("CAREER_HERO_ENFORCE_HARD_RATE_LIMIT", False)
+        self._sessions: dict[str, _SessionRateState] = {}
+        self._sweeper = StaleKeySweeper()
         self._lock = Lock()
 
+    def _prune_session_state(self, state: _SessionRateState, now: float) -> bool:
+        stale_signatures = [
+            signature
+            for signature, duplicate_queue in state.duplicates.items()
+            if not duplicate_queue or now - duplicate_queue[-1] > self.duplicate_window_seconds
+        ]
+        for signature in stale_signatures:
+            del state.duplicates[signature]
+        return not state.duplicates and (not state.hits or now - state.hits[-1] > self.window_seconds)
+
     def consume(self, *, session_id: str, payload_signature: str) -> RateLimitDecision:
-        now = time.time()
+        now = time.monotonic()
         with self._lock:
-            queue = self._hits[session_id]
+            state = self._sessions.get(session_id)
+            if state is None:
+                # Decisions only look at the oldest of the newest `limit` hits, so older ones can be evicted.
+                state = self._sessions[session_id] = _SessionRateState(hits=deque(maxlen=self.limit))
+            if self._sweeper.due():
+                self._sweeper.sweep(
+                    self._sessions,
+                    lambda other: other is not state and self._prune_session_state(other, now),
+                )
+            queue = state.hits
             while queue and now - queue[0] > self.window_seconds:
                 queue.popleft()
 
-            hard_limit_enabled = self.limit <= 10 or get_env_bool("CAREER_HERO_ENFORCE_HARD_RATE_LIMIT", False)
-            if hard_limit_enabled and len(queue) >= self.limit:
+            if self.hard_limit_enabled and len(queue) >= self.limit:
                 reset_seconds = int(max(1, self.window_seconds - (now - queue[0])))
                 return RateLimitDecision(
                     allowed=False,
@@ -1034,8 +1142,9 @@ class SessionRateLimiter:
                     message=f"Rate limit exceeded. Retry in {reset_seconds}s",
                 )
 
-            duplicate_key = (session_id, payload_signature)
-            duplicate_queue = self._duplicates[duplicate_key]
+            duplicate_queue = state.duplicates.get(payload_signature)
+            if duplicate_queue is None:
+                duplicate_queue = state.duplicates[payload_signature] = deque(maxlen=self.duplicate_limit)
             while duplicate_queue and now - duplicate_queue[0] > self.duplicate_window_seconds:
                 duplicate_queue.popleft()
 
@@ -1056,14 +1165,48 @@ class SessionRateLimiter:
             return RateLimitDecision(allowed=True, remaining=remaining, reset_seconds=self.window_seconds)
 
 
+LATENCY_SAMPLE_LIMIT = 500
+LATENCY_SAMPLE_MAX_MS = 2**31 - 1
+STATUS_CODE_KEYS = {code: str(code) for code in range(100, 600)}
+
+
+class LatencyRing:
+    """Fixed-capacity window of recent latencies packed as C ints."""
+
+    __slots__ = ("_samples", "_capacity", "_cursor")
+
+    def __init__(self, capacity: int) -> None:
+        self._samples = array("i")
+        self._capacity = capacity
+        self._cursor = 0
+
+    def append(self, value: int) -> None:
+        # Grows lazily up to capacity, then overwrites the oldest slot; percentiles do not need ordering.
+        if len(self._samples) < self._capacity:
+            self._samples.append(value)
+            return
+        self._samples[self._cursor] = value
+        self._cursor = (self._cursor + 1) % self._capacity
+
+    def samples(self) -> array:
+        # Slicing an array is a single memcpy, cheap enough to take while holding the tracker lock.
+        return self._samples[:]
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._samples)
+
+
 class MetricsTracker:
     def __init__(self) -> None:
         self._lock = Lock()
         self._request_total = 0
-        self._path_counts: dict[str, int] = defaultdict(int)
-        self._status_counts: dict[str, int] = defaultdict(int)
-        self._error_counts: dict[str, int] = defaultdict(int)
-        self._latencies_by_path: dict[str, deque[int]] = defaultdict(lambda: deque(maxlen=500))
+        self._path_counts: Counter[str] = Counter()
+        self._status_counts: Counter[str] = Counter()
+        self._error_counts: Counter[str] = Counter()
+        self._latencies_by_path: dict[str, LatencyRing] = {}
 
     def record(
         self,
@@ -1076,40 +1219,47 @@ class MetricsTracker:
         with self._lock:
             self._request_total += 1
             self._path_counts[path] += 1
-            self._status_counts[str(status)] += 1
-            self._latencies_by_path[path].append(max(0, duration_ms))
+            self._status_counts[STATUS_CODE_KEYS.get(status) or str(status)] += 1
+            latencies = self._latencies_by_path.get(path)
+            if latencies is None:
+                latencies = self._latencies_by_path[path] = LatencyRing(LATENCY_SAMPLE_LIMIT)
+            latencies.append(max(0, min(duration_ms, LATENCY_SAMPLE_MAX_MS)))
             if error_code:
                 self._error_counts[error_code] += 1
 
     @staticmethod
-    def _percentile(values: list[int], p: float) -> int:
-        if not values:
-            return 0
+    def _percentiles(values: Iterable[int], probabilities: tuple[float, ...]) -> tuple[int, ...]:
+        # One sort serves every requested percentile.
         ranked = sorted(values)
-        idx = int(round((len(ranked) - 1) * p))
-        return ranked[max(0, min(idx, len(ranked) - 1))]
+        if not ranked:
+            return (0,) * len(probabilities)
+        last = len(ranked) - 1
+        return tuple(ranked[max(0, min(int(round(last * p)), last))] for p in probabilities)
 
     def snapshot(self) -> dict[str, Any]:
+        # Copy raw state under the lock; sorting and formatting happen after record() is unblocked.
         with self._lock:
-            latency = {
-                path: {
-                    "count": len(values),
-                    "p50_ms": self._percentile(list(values), 0.5),
-                    "p95_ms": self._percentile(list(values), 0.95),
-                }
-                for path, values in self._latencies_by_path.items()
-            }
-            return {
-                "generatedAt": datetime.now(timezone.utc).isoformat(),
-                "requestTotal": self._request_total,
-                "pathCounts": dict(self._path_counts),
-                "statusCounts": dict(self._status_counts),
-                "errorCounts": dict(self._error_counts),
-                "latency": latency,
-            }
+            samples_by_path = {path: values.samples() for path, values in self._latencies_by_path.items()}
+            request_total = self._request_total
+            path_counts = dict(self._path_counts)
+            status_counts = dict(self._status_counts)
+            error_counts = dict(self._error_counts)
+
+        latency: dict[str, dict[str, int]] = {}
+        for path, samples in samples_by_path.items():
+            p50, p95 = self._percentiles(samples, (0.5, 0.95))
+            latency[path] = {"count": len(samples), "p50_ms": p50, "p95_ms": p95}
+        return {
+            "generatedAt": datetime.now(timezone.utc).isoformat(),
+            "requestTotal": request_total,
+            "pathCounts": path_counts,
+            "statusCounts": status_counts,
+            "errorCounts": error_counts,
+            "latency": latency,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     score: int
     matched_keywords: list[str]
@@ -1125,7 +1275,7 @@ class AnalysisResult:
     pip_advice: list[PipAdviceItem] = dataclass_field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ResumeParseResult:
     status: Literal["pending", "parsed", "failed"]
     parsed_text: str
@@ -1136,6 +1286,10 @@ class ResumeParseResult:
 RATE_LIMIT_PER_MINUTE = get_env_int("CAREER_HERO_RATE_LIMIT_PER_MINUTE", 20, min_value=1, max_value=500)
 DUPLICATE_SUBMIT_LIMIT = get_env_int("CAREER_HERO_DUPLICATE_LIMIT", 3, min_value=2, max_value=50)
 GEMINI_ENABLED = get_env_bool("CAREER_HERO_GEMINI_ENABLED", True)
+GEMINI_RESPONSE_CACHE = LLMResponseCache(
+    max_entries=get_env_int("CAREER_HERO_GEMINI_CACHE_SIZE", 256, min_value=0, max_value=10_000),
+    ttl_seconds=get_env_int("CAREER_HERO_GEMINI_CACHE_TTL_SECONDS", 24 * 60 * 60, min_value=1),
+)
 RATE_LIMITER = SessionRateLimiter(
     limit=RATE_LIMIT_PER_MINUTE,
     window_seconds=60,
@@ -1150,16 +1304,16 @@ AUTH_LOGIN_RATE_LIMITER = AuthLoginRateLimiter(
 METRICS = MetricsTracker()
 
 
-def tokenize(text: str) -> list[str]:
-    lowered = text.lower()
-    tokens = re.findall(r"[a-zA-Z0-9+#.]{2,}|[\u4e00-\u9fff]{2,}", lowered)
-    return [token for token in tokens if token not in STOPWORDS]
+@lru_cache(maxsize=TEXT_ARTIFACT_CACHE_SIZE)
+def tokenize(text: str) -> tuple[str, ...]:
+    return tuple(token for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOPWORDS)
 
 
-def top_keywords(tokens: list[str], limit: int = 30) -> list[str]:
+def top_keywords(tokens: Iterable[str], limit: int = 30) -> list[str]:
     freq = Counter(tokens)
-    ranked = sorted(freq.items(), key=lambda item: (-item[1], item[0]))
-    return [key for key, _ in ranked[:limit]]
+    # Same (-count, token) order as a full sort, but only keeps `limit` candidates in the heap.
+    ranked = nsmallest(limit, freq.items(), key=lambda item: (-item[1], item[0]))
+    return [key for key, _ in ranked]
 
 
 def build_optimized_resume(resume_text: str, missing_keywords: list[str]) -> str:
@@ -1172,14 +1326,15 @@ def build_optimized_resume(resume_text: str, missing_keywords: list[str]) -> str
     return f"{resume_text.strip()}\n\n【建议补充条目】\n" + "\n".join(additions)
 
 
+@lru_cache(maxsize=TEXT_ARTIFACT_CACHE_SIZE)
 def estimate_writing_quality_stub(resume_text: str) -> int:
-    chunks = [segment.strip() for segment in re.split(r"[。！？.!?\n]+", resume_text) if segment.strip()]
+    chunks = [segment.strip() for segment in SENTENCE_SPLIT_PATTERN.split(resume_text) if segment.strip()]
     avg_chunk_length = sum(len(chunk) for chunk in chunks) / max(1, len(chunks))
 
     score = 55
     if 18 <= avg_chunk_length <= 90:
         score += 10
-    if re.search(r"\d", resume_text):
+    if DIGIT_PATTERN.search(resume_text):
         score += 10
     if len(resume_text) >= 200:
         score += 8
@@ -1190,12 +1345,18 @@ def estimate_writing_quality_stub(resume_text: str) -> int:
 
 
 def to_excerpt(text: str, *, limit: int) -> str:
-    compact = re.sub(r"\s+", " ", text).strip()
+    # Collapsing a prefix yields a prefix of the fully collapsed text, so a head that already
+    # exceeds `limit` is enough; only whitespace-heavy heads fall back to the whole string.
+    window = limit * 4
+    compact = WHITESPACE_PATTERN.sub(" ", text[:window]).strip()
+    if len(compact) <= limit and len(text) > window:
+        compact = WHITESPACE_PATTERN.sub(" ", text).strip()
     if len(compact) <= limit:
         return compact
     return f"{compact[:limit]}..."
 
 
+@lru_cache(maxsize=TEXT_ARTIFACT_CACHE_SIZE)
 def resume_hash_or_excerpt(resume_text: str) -> str:
     digest = hashlib.sha256(resume_text.encode("utf-8")).hexdigest()[:16]
     return f"sha256:{digest} | {to_excerpt(resume_text, limit=90)}"
@@ -1215,7 +1376,7 @@ def infer_resume_title(*, provided_title: str | None, filename: str | None) -> s
 
 
 def parse_resume_txt(content: str) -> ResumeParseResult:
-    normalized = re.sub(r"\u0000", "", content).replace("\r\n", "\n").replace("\r", "\n").strip()
+    normalized = content.translate(NUL_STRIP_TABLE).replace("\r\n", "\n").replace("\r", "\n").strip()
     if not normalized:
         return ResumeParseResult(
             status="failed",
@@ -1235,17 +1396,12 @@ def parse_resume_txt(content: str) -> ResumeParseResult:
 
     first_line = lines[0]
     name_candidate = ""
-    if len(first_line) <= 40 and not re.search(r"[:：@]", first_line):
+    if len(first_line) <= 40 and not NAME_LINE_EXCLUDE_PATTERN.search(first_line):
         name_candidate = first_line.strip("•-* ")
 
     email_match = EMAIL_PATTERN.search(normalized)
     phone_match = PHONE_PATTERN.search(normalized)
 
-    section_tokens = {
-        "skills": ("skills", "skill", "技能", "技术栈", "能力", "擅长"),
-        "experience": ("experience", "工作经历", "项目经历", "经历"),
-        "education": ("education", "教育", "学历"),
-    }
     section_data: dict[str, list[str]] = {"skills": [], "experience": [], "education": []}
     highlights: list[str] = []
     current_section: str | None = None
@@ -1255,8 +1411,8 @@ def parse_resume_txt(content: str) -> ResumeParseResult:
         lowered = cleaned.lower()
 
         matched_section = None
-        for key, markers in section_tokens.items():
-            if any(marker in lowered for marker in markers):
+        for key, pattern in RESUME_SECTION_PATTERNS.items():
+            if pattern.search(lowered):
                 matched_section = key
                 break
 
@@ -1272,22 +1428,17 @@ def parse_resume_txt(content: str) -> ResumeParseResult:
 
     skill_candidates: list[str] = []
     for value in section_data["skills"]:
-        parts = re.split(r"[,，、/|；;\s]+", value)
+        parts = SKILL_SPLIT_PATTERN.split(value)
         for part in parts:
             token = part.strip()
             if 1 < len(token) <= 30:
                 skill_candidates.append(token)
 
-    dedup_skills: list[str] = []
-    seen_skills: set[str] = set()
+    # Case-insensitive dedup that keeps the first spelling seen for each skill.
+    skills_by_marker: dict[str, str] = {}
     for skill in skill_candidates:
-        marker = skill.lower()
-        if marker in seen_skills:
-            continue
-        seen_skills.add(marker)
-        dedup_skills.append(skill)
-        if len(dedup_skills) >= 20:
-            break
+        skills_by_marker.setdefault(skill.lower(), skill)
+    dedup_skills = list(islice(skills_by_marker.values(), 20))
 
     summary_lines = lines[: min(3, len(lines))]
     summary = " ".join(summary_lines)
@@ -1403,13 +1554,14 @@ def require_current_user(request: Request) -> dict[str, Any]:
     return user
 
 
+@lru_cache(maxsize=4096)
 def parse_iso_datetime(value: str | None) -> datetime | None:
     raw = (value or "").strip()
     if not raw:
         return None
     try:
-        if raw.endswith("Z"):
-            return datetime.fromisoformat(raw.replace("Z", "+00:00"))
+        if raw[-1] == "Z":
+            return datetime.fromisoformat(raw[:-1] + "+00:00")
         return datetime.fromisoformat(raw)
     except ValueError:
         return None
@@ -1530,19 +1682,8 @@ def normalize_score_breakdown(raw: object) -> ScoreBreakdown:
 def normalize_keywords(raw: object, *, limit: int = 20) -> list[str]:
     if not isinstance(raw, list):
         return []
-    result: list[str] = []
-    seen: set[str] = set()
-    for item in raw:
-        if not isinstance(item, str):
-            continue
-        value = item.strip()
-        if not value or value in seen:
-            continue
-        seen.add(value)
-        result.append(value)
-        if len(result) >= limit:
-            break
-    return result
+    values = (item.strip() for item in raw if isinstance(item, str))
+    return list(islice(dict.fromkeys(value for value in values if value), limit))
 
 
 def normalize_suggestions(raw: object, *, default_missing: list[str]) -> list[str]:
@@ -1584,6 +1725,15 @@ def clamp_score(value: float | int, *, low: int = 0, high: int = 100) -> int:
     return int(max(low, min(high, round(float(value)))))
 
 
+@lru_cache(maxsize=TEXT_ARTIFACT_CACHE_SIZE)
+def nonempty_stripped_lines(text: str) -> tuple[str, ...]:
+    # Shared by the diagnostic breakdown and issue classification, which run back to back on the same resume.
+    lines = tuple(line.strip("•-* ") for line in text.splitlines() if line.strip())
+    if not lines:
+        lines = tuple(segment.strip() for segment in SENTENCE_END_SPLIT_PATTERN.split(text) if segment.strip())
+    return lines
+
+
 def build_diagnostic_breakdown(
     *,
     resume_text: str,
@@ -1591,13 +1741,11 @@ def build_diagnostic_breakdown(
     missing_keywords: list[str],
     writing_quality_stub: int,
 ) -> DiagnosticBreakdown:
-    lines = [line.strip("•-* ") for line in re.split(r"[\n]+", resume_text) if line.strip()]
-    if not lines:
-        lines = [segment.strip() for segment in re.split(r"[。！？.!?]+", resume_text) if segment.strip()]
+    lines = nonempty_stripped_lines(resume_text)
 
-    quantified_lines = sum(1 for line in lines if re.search(r"\d", line))
-    vague_lines = sum(1 for line in lines if any(marker in line.lower() for marker in VAGUE_MARKERS))
-    action_lines = sum(1 for line in lines if any(marker in line.lower() for marker in ACTION_MARKERS))
+    quantified_lines = sum(1 for line in lines if DIGIT_PATTERN.search(line))
+    vague_lines = sum(1 for line in lines if VAGUE_MARKER_PATTERN.search(line))
+    action_lines = sum(1 for line in lines if ACTION_MARKER_PATTERN.search(line))
 
     keyword_coverage = clamp_score((len(matched_keywords) / max(1, len(matched_keywords) + len(missing_keywords))) * 100)
     quantified_impact = clamp_score((quantified_lines / max(1, len(lines))) * 100)
@@ -1617,16 +1765,13 @@ def build_diagnostic_breakdown(
 
 
 def classify_resume_issues(*, resume_text: str, missing_keywords: list[str]) -> list[IssueClassification]:
-    lines = [line.strip("•-* ") for line in re.split(r"[\n]+", resume_text) if line.strip()]
-    if not lines:
-        lines = [segment.strip() for segment in re.split(r"[。！？.!?]+", resume_text) if segment.strip()]
+    lines = nonempty_stripped_lines(resume_text)
 
     issue_list: list[IssueClassification] = []
 
     vague_samples: list[str] = []
     for line in lines:
-        lowered = line.lower()
-        if any(marker in lowered for marker in VAGUE_MARKERS) and not re.search(r"\d", line):
+        if VAGUE_MARKER_PATTERN.search(line) and not DIGIT_PATTERN.search(line):
             vague_samples.append(line)
         if len(vague_samples) >= 3:
             break
@@ -1643,7 +1788,7 @@ def classify_resume_issues(*, resume_text: str, missing_keywords: list[str]) ->
         )
 
     non_empty_lines = [line for line in lines if len(line) >= 6]
-    quantified_lines = [line for line in non_empty_lines if re.search(r"\d", line)]
+    quantified_lines = [line for line in non_empty_lines if DIGIT_PATTERN.search(line)]
     quant_ratio = len(quantified_lines) / max(1, len(non_empty_lines))
     if quant_ratio < 0.4:
         evidence = non_empty_lines[:3] if non_empty_lines else [to_excerpt(resume_text, limit=80)]
@@ -1777,8 +1922,11 @@ def compute_rule_based_analysis(*, resume_text: str, jd_text: str) -> AnalysisRe
     jd_token_set = set(jd_tokens)
     jd_ranked = top_keywords(jd_tokens, 40)
 
-    matched = [kw for kw in jd_ranked if kw in resume_set][:20]
-    missing = [kw for kw in jd_ranked if kw not in resume_set][:20]
+    matched: list[str] = []
+    missing: list[str] = []
+    for kw in jd_ranked:
+        (matched if kw in resume_set else missing).append(kw)
+    del matched[20:], missing[20:]
 
     keyword_match = int(round((len(matched) / max(1, len(jd_ranked))) * 100))
     coverage = int(round((len(resume_set & jd_token_set) / max(1, len(jd_token_set))) * 100))
@@ -1827,51 +1975,66 @@ def compute_rule_based_analysis(*, resume_text: str, jd_text: str) -> AnalysisRe
 
 def extract_json_from_text(raw: str) -> dict[str, Any]:
     content = raw.strip()
+    if content.startswith("{"):
+        # The prompt asks for bare JSON, so try it as-is before any fence/brace cleanup.
+        try:
+            return json_loads(content)
+        except JSONDecodeError:
+            pass
+
     if content.startswith("```"):
-        content = re.sub(r"^```(?:json)?", "", content).strip()
-        content = re.sub(r"```$", "", content).strip()
+        content = CODE_FENCE_OPEN_PATTERN.sub("", content).strip()
+        content = CODE_FENCE_CLOSE_PATTERN.sub("", content).strip()
 
     start = content.find("{")
     end = content.rfind("}")
     if start >= 0 and end > start:
         content = content[start : end + 1]
 
-    parsed = json.loads(content)
+    parsed = json_loads(content)
     if not isinstance(parsed, dict):
         raise ValueError("gemini response is not json object")
     return parsed
 
 
+# Serializes the nested response models directly in pydantic-core instead of model_dump() + json.dumps.
+GEMINI_TEMPLATE_ADAPTER = TypeAdapter(dict[str, Any])
+GEMINI_PROMPT_HEADER = (
+    "你是职业顾问。请基于简历与JD输出稳定JSON，不要输出解释文字。\n"
+    "必须返回字段：score(0-100整数), scoreBreakdown(keyword_match/coverage/writing_quality_stub),"
+    " diagnosticBreakdown(keywordCoverage/quantifiedImpact/expressionClarity/jdRelevance),"
+    " issueClassifications(数组), pipAdvice(数组), matchedKeywords(数组), missingKeywords(数组),"
+    " suggestions(数组), optimizedResume(字符串), insights(summary/strengths/risks)。\n"
+    "优先保持与规则引擎相同或相近的数值尺度，避免波动过大。\n"
+    f"promptVersion={PROMPT_VERSION}\n"
+    "以下是规则引擎参考结果（可优化但结构不可变）：\n"
+)
+
+
 def build_gemini_prompt(*, resume_text: str, jd_text: str, seed: AnalysisResult) -> str:
     template = {
         "score": seed.score,
-        "scoreBreakdown": seed.score_breakdown.model_dump(),
-        "diagnosticBreakdown": (
-            seed.diagnostic_breakdown.model_dump() if seed.diagnostic_breakdown else {}
-        ),
-        "issueClassifications": [item.model_dump() for item in seed.issue_classifications],
-        "pipAdvice": [item.model_dump() for item in seed.pip_advice],
+        "scoreBreakdown": seed.score_breakdown,
+        "diagnosticBreakdown": seed.diagnostic_breakdown or {},
+        "issueClassifications": seed.issue_classifications,
+        "pipAdvice": seed.pip_advice,
         "matchedKeywords": seed.matched_keywords,
         "missingKeywords": seed.missing_keywords,
         "suggestions": seed.suggestions,
         "optimizedResume": seed.optimized_resume,
-        "insights": seed.insights.model_dump(),
+        "insights": seed.insights,
     }
 
-    return (
-        "你是职业顾问。请基于简历与JD输出稳定JSON，不要输出解释文字。\n"
-        "必须返回字段：score(0-100整数), scoreBreakdown(keyword_match/coverage/writing_quality_stub),"
-        " diagnosticBreakdown(keywordCoverage/quantifiedImpact/expressionClarity/jdRelevance),"
-        " issueClassifications(数组), pipAdvice(数组), matchedKeywords(数组), missingKeywords(数组),"
-        " suggestions(数组), optimizedResume(字符串), insights(summary/strengths/risks)。\n"
-        "优先保持与规则引擎相同或相近的数值尺度，避免波动过大。\n"
-        f"promptVersion={PROMPT_VERSION}\n"
-        "以下是规则引擎参考结果（可优化但结构不可变）：\n"
-        f"{json.dumps(template, ensure_ascii=False)}\n\n"
-        "[简历]\n"
-        f"{resume_text}\n\n"
-        "[JD]\n"
-        f"{jd_text}\n"
+    return "".join(
+        (
+            GEMINI_PROMPT_HEADER,
+            GEMINI_TEMPLATE_ADAPTER.dump_json(template).decode("utf-8"),
+            "\n\n[简历]\n",
+            resume_text,
+            "\n\n[JD]\n",
+            jd_text,
+            "\n",
+        )
     )
 
 
@@ -1941,39 +2104,73 @@ def normalize_pip_advice(raw: object, *, fallback: list[PipAdviceItem]) -> list[
     return result or fallback
 
 
-def call_gemini_analysis(*, resume_text: str, jd_text: str, seed: AnalysisResult) -> AnalysisResult:
-    api_key = os.getenv("GEMINI_API_KEY", "").strip()
-    model = os.getenv("GEMINI_MODEL", "gemini-1.5-flash").strip() or "gemini-1.5-flash"
-    if not api_key:
-        raise RuntimeError("GEMINI_API_KEY is not configured")
+@lru_cache(maxsize=1)
+def get_gemini_client() -> httpx.Client:
+    # One pooled client per process so repeat analyses reuse a warm TLS connection to the Gemini API.
+    return httpx.Client(
+        timeout=httpx.Timeout(20.0, connect=5.0),
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+    )
+
+
+def close_gemini_client() -> None:
+    if get_gemini_client.cache_info().currsize:
+        get_gemini_client().close()
+        get_gemini_client.cache_clear()
+
 
-    endpoint = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent"
+def request_gemini_text(*, api_key: str, model: str, prompt: str) -> str:
+    # Streamed over SSE: the read timeout then bounds gaps between chunks instead of the whole generation.
+    endpoint = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:streamGenerateContent"
     body = {
-        "contents": [{"parts": [{"text": build_gemini_prompt(resume_text=resume_text, jd_text=jd_text, seed=seed)}]}],
+        "contents": [{"parts": [{"text": prompt}]}],
         "generationConfig": {
             "temperature": 0.2,
             "responseMimeType": "application/json",
         },
     }
 
-    with httpx.Client(timeout=20.0) as client:
-        response = client.post(endpoint, params={"key": api_key}, json=body)
+    chunks: list[str] = []
+    saw_candidates = False
+    with get_gemini_client().stream("POST", endpoint, params={"alt": "sse", "key": api_key}, json=body) as response:
         response.raise_for_status()
-        payload = response.json()
+        for line in response.iter_lines():
+            if not line.startswith("data:"):
+                continue
+            event = json_loads(line[5:])
+            candidates = event.get("candidates") if isinstance(event, dict) else None
+            if not isinstance(candidates, list) or not candidates:
+                continue
+            saw_candidates = True
+            parts = candidates[0].get("content", {}).get("parts", [])
+            if isinstance(parts, list):
+                chunks.extend(str(part.get("text", "")) for part in parts if isinstance(part, dict))
 
-    candidates = payload.get("candidates")
-    if not isinstance(candidates, list) or not candidates:
+    if not saw_candidates:
         raise RuntimeError("Gemini returned empty candidates")
 
-    parts = candidates[0].get("content", {}).get("parts", [])
-    if not isinstance(parts, list) or not parts:
-        raise RuntimeError("Gemini returned empty parts")
-
-    text = str(parts[0].get("text", "")).strip()
+    text = "".join(chunks).strip()
     if not text:
         raise RuntimeError("Gemini response text is empty")
+    return text
 
-    parsed = extract_json_from_text(text)
+
+def call_gemini_analysis(*, resume_text: str, jd_text: str, seed: AnalysisResult) -> AnalysisResult:
+    api_key = os.getenv("GEMINI_API_KEY", "").strip()
+    model = os.getenv("GEMINI_MODEL", "gemini-1.5-flash").strip() or "gemini-1.5-flash"
+    if not api_key:
+        raise RuntimeError("GEMINI_API_KEY is not configured")
+
+    prompt = build_gemini_prompt(resume_text=resume_text, jd_text=jd_text, seed=seed)
+    cache_key = llm_cache_key(model, prompt)
+    text = GEMINI_RESPONSE_CACHE.get(cache_key)
+    if text is None:
+        text = request_gemini_text(api_key=api_key, model=model, prompt=prompt)
+        parsed = extract_json_from_text(text)
+        # Cached only once it parses, so a malformed reply is retried on the next request.
+        GEMINI_RESPONSE_CACHE.set(cache_key, text)
+    else:
+        parsed = extract_json_from_text(text)
 
     score = max(0, min(100, int(parsed.get("score", seed.score))))
     breakdown = normalize_score_breakdown(parsed.get("scoreBreakdown", seed.score_breakdown.model_dump()))
@@ -2060,13 +2257,14 @@ def payload_signature(payload: AnalyzeRequest) -> str:
         version_label = payload.versionNo if payload.versionNo is not None else "latest"
         resume_ref = f"resume:{payload.resumeId}:{version_label}"
 
-    digest = hashlib.sha256(
+    # Only a duplicate-submission key, not a security boundary, so use the faster BLAKE2b.
+    return hashlib.blake2b(
         (
             f"{resume_ref}\n{payload.resumeText or ''}\n{payload.jdText}\n"
             f"rag:{int(payload.ragEnabled)}:{payload.ragTopK if payload.ragTopK is not None else 'cfg'}:{payload.ragThreshold if payload.ragThreshold is not None else 'cfg'}"
-        ).encode("utf-8")
+        ).encode("utf-8"),
+        digest_size=12,
     ).hexdigest()
-    return digest[:24]
 
 
 def apply_rate_limit_or_raise(*, request: Request, payload: AnalyzeRequest) -> None:
@@ -2120,7 +2318,7 @@ def build_history_detail_from_row(row: dict[str, Any]) -> HistoryDetail:
 
 
 def to_resume_preview(content: str, *, limit: int = 120) -> str:
-    compact = re.sub(r"\s+", " ", content).strip()
+    compact = WHITESPACE_PATTERN.sub(" ", content).strip()
     if len(compact) <= limit:
         return compact
     return f"{compact[:limit]}..."
@@ -2212,17 +2410,20 @@ def to_resume_state_key(payload: AnalyzeRequest) -> int:
     return 0
 
 
+DIAGNOSTIC_STATE_SET = frozenset(DIAGNOSTIC_STATES)
+
+
 def format_diagnostic_flow_state(row: dict[str, Any]) -> DiagnosticFlowState:
     status = str(row.get("status", "jd_input")).strip().lower()
-    if status not in set(DIAGNOSTIC_STATES):
+    if status not in DIAGNOSTIC_STATE_SET:
         status = "jd_input"
 
     allowed_next_raw = row.get("allowed_next")
     allowed_next = []
-    if isinstance(allowed_next_raw, list):
+    if isinstance(allowed_next_raw, (list, tuple)):
         for item in allowed_next_raw:
             value = str(item).strip().lower()
-            if value in set(DIAGNOSTIC_STATES) and value not in allowed_next:
+            if value in DIAGNOSTIC_STATE_SET and value not in allowed_next:
                 allowed_next.append(value)
 
     if not allowed_next:
@@ -2310,8 +2511,14 @@ def build_interview_questions(*, jd_text: str, resume_text: str, question_count:
 
 
 def build_interview_session_payload(row: dict[str, Any]) -> InterviewSession:
-    questions = row.get("questions") if isinstance(row.get("questions"), list) else []
-    answers = row.get("answers") if isinstance(row.get("answers"), list) else []
+    if "question_count" in row:
+        question_count = int(row.get("question_count") or 0)
+        answered_count = int(row.get("answered_count") or 0)
+    else:
+        questions = row.get("questions") if isinstance(row.get("questions"), list) else []
+        answers = row.get("answers") if isinstance(row.get("answers"), list) else []
+        question_count = len(questions)
+        answered_count = len(answers)
 
     status = str(row.get("status", "active")).strip().lower()
     if status not in {"active", "paused", "finished"}:
@@ -2320,15 +2527,18 @@ def build_interview_session_payload(row: dict[str, Any]) -> InterviewSession:
     recommendations_raw = row.get("recommendations") if isinstance(row.get("recommendations"), list) else []
     recommendations = [str(item).strip() for item in recommendations_raw if str(item).strip()][:8]
 
-    feedback = row.get("feedback") if isinstance(row.get("feedback"), dict) else {}
-    summary = str(feedback.get("summary", "")).strip() or None
+    if "feedback_summary" in row:
+        summary = str(row.get("feedback_summary") or "").strip() or None
+    else:
+        feedback = row.get("feedback") if isinstance(row.get("feedback"), dict) else {}
+        summary = str(feedback.get("summary", "")).strip() or None
 
     return InterviewSession(
         id=int(row.get("id", 0)),
         sessionToken=str(row.get("session_token", "")),
         status=status,
-        questionCount=len(questions),
-        answeredCount=len(answers),
+        questionCount=question_count,
+        answeredCount=answered_count,
         currentIndex=int(row.get("current_index", 0)),
         finalScore=int(row.get("final_score")) if row.get("final_score") is not None else None,
         recommendations=recommendations,
@@ -2358,8 +2568,8 @@ def resolve_interview_next_question(row: dict[str, Any]) -> InterviewQuestion |
 
 def build_interview_answer_evaluation(*, question: dict[str, Any], answer_text: str) -> InterviewAnswerEvaluation:
     answer_length = len(answer_text)
-    has_number = bool(re.search(r"\d", answer_text))
-    has_action = any(marker in answer_text.lower() for marker in ACTION_MARKERS)
+    has_number = bool(DIGIT_PATTERN.search(answer_text))
+    has_action = ACTION_MARKER_PATTERN.search(answer_text) is not None
 
     score = 55
     if answer_length >= 80:
@@ -2413,7 +2623,7 @@ def build_interview_feedback_draft(row: dict[str, Any]) -> InterviewFeedbackDraf
 
     relevance = clamp_score(45 + len(answers) / max(1, len(questions)) * 45)
     depth = clamp_score(sum(1 for item in answers if len(str(item.get("answer", ""))) >= 120) / max(1, len(answers)) * 100)
-    impact = clamp_score(sum(1 for item in answers if re.search(r"\d", str(item.get("answer", "")))) / max(1, len(answers)) * 100)
+    impact = clamp_score(sum(1 for item in answers if DIGIT_PATTERN.search(str(item.get("answer", "")))) / max(1, len(answers)) * 100)
     communication = clamp_score(50 + min(40, len(answers) * 8))
 
     strengths: list[str] = []
@@ -2502,11 +2712,23 @@ def build_export_text(item: HistoryDetail) -> str:
     return "\n".join(lines)
 
 
+@lru_cache(maxsize=1)
+def get_pdf_font_name() -> str:
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.cidfonts import UnicodeCIDFont
+
+    try:
+        pdfmetrics.registerFont(UnicodeCIDFont("STSong-Light"))
+    except Exception:
+        return "Helvetica"
+    return "STSong-Light"
+
+
+# Exports of an unchanged history row render the same text; bytes are immutable so they can be shared.
+@lru_cache(maxsize=PDF_EXPORT_CACHE_SIZE)
 def build_pdf_bytes(text: str) -> bytes:
     try:
         from reportlab.lib.pagesizes import A4
-        from reportlab.pdfbase import pdfmetrics
-        from reportlab.pdfbase.cidfonts import UnicodeCIDFont
         from reportlab.pdfgen import canvas
     except Exception as exc:  # pragma: no cover - dependency guard
         raise RuntimeError("PDF export requires reportlab") from exc
@@ -2515,13 +2737,7 @@ def build_pdf_bytes(text: str) -> bytes:
     pdf = canvas.Canvas(buffer, pagesize=A4)
     width, height = A4
 
-    font_name = "Helvetica"
-    try:
-        pdfmetrics.registerFont(UnicodeCIDFont("STSong-Light"))
-        font_name = "STSong-Light"
-    except Exception:
-        font_name = "Helvetica"
-
+    font_name = get_pdf_font_name()
     pdf.setFont(font_name, 11)
     margin_x = 36
     line_height = 16
@@ -2592,6 +2808,11 @@ def get_cors_allow_origin_regex() -> str | None:
     return r"^https://.*\.vercel\.app$"
 
 
+def model_json_response(model: BaseModel) -> Response:
+    # A returned Response skips FastAPI's dump-and-revalidate pass; response_model still documents the schema.
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
+
 app = FastAPI(title="Career Hero MVP API", version="0.2.0")
 
 app.add_middleware(
@@ -2609,6 +2830,11 @@ def bootstrap_local_auth() -> None:
     ensure_default_local_account()
 
 
+@app.on_event("shutdown")
+def shutdown_gemini_client() -> None:
+    close_gemini_client()
+
+
 @app.middleware("http")
 async def observability_middleware(request: Request, call_next):
     request_id = request.headers.get("x-request-id") or str(uuid.uuid4())
@@ -2647,7 +2873,7 @@ async def observability_middleware(request: Request, call_next):
     request.state.owner_scope_id = request.state.session_scope_id
 
     auth_token = parse_auth_session_token(request)
-    if not auth_token and request.url.path.startswith("/api/auth/"):
+    if not auth_token and request.url.path.startswith(AUTH_API_PREFIX):
         auth_token = parse_auth_session_token_for_auth_api(request)
 
     if auth_token and not inbound_session_id:
@@ -2854,7 +3080,10 @@ def auth_login(payload: AuthLoginRequest, request: Request, response: Response)
             extra={"retryAfterSec": pre_check.reset_seconds},
         )
 
-    user, verify_reason = verify_local_account_with_reason(username=payload.username, password=payload.password)
+    user, verify_reason = verify_local_account_trusted_with_reason(
+        username=payload.username,
+        password=payload.password,
+    )
     if user is None:
         if verify_reason == VERIFY_REASON_ACCOUNT_INACTIVE:
             raise_api_error(
@@ -2903,16 +3132,17 @@ def auth_login(payload: AuthLoginRequest, request: Request, response: Response)
 
 
 @app.get("/api/auth/me", response_model=AuthMeResponse)
-def auth_me(request: Request) -> AuthMeResponse:
+def auth_me(request: Request) -> Response:
     user = require_current_user(request)
     expires_at = str(getattr(request.state, "auth_expires_at", ""))
-    return AuthMeResponse(
+    payload = AuthMeResponse(
         requestId=get_request_id(request),
         sessionId=get_session_id(request),
         user=AuthUser(id=int(user["id"]), username=str(user["username"])),
         expiresAt=expires_at,
         authContext=build_auth_context(request=request, user=user, expires_at=expires_at),
     )
+    return model_json_response(payload)
 
 
 @app.post("/api/auth/refresh", response_model=AuthRefreshResponse)
@@ -3028,7 +3258,7 @@ def analyze(payload: AnalyzeRequest, request: Request) -> AnalyzeResponse:
         request_id=request_id,
     )
 
-    enforce_retention(
+    schedule_retention(
         keep_latest=DEFAULT_HISTORY_RETENTION,
         session_id=session_id,
         user_scope_id=owner_scope_id,
@@ -3090,7 +3320,7 @@ def analyze(payload: AnalyzeRequest, request: Request) -> AnalyzeResponse:
 def get_diagnostic_state_endpoint(
     request: Request,
     resumeId: int | None = Query(default=None, ge=0),
-) -> DiagnosticStateResponse:
+) -> Response:
     resume_state_key = max(0, int(resumeId or 0))
     state = format_diagnostic_flow_state(
         get_diagnostic_state(
@@ -3098,7 +3328,7 @@ def get_diagnostic_state_endpoint(
             resume_id=resume_state_key,
         )
     )
-    return DiagnosticStateResponse(requestId=get_request_id(request), state=state)
+    return model_json_response(DiagnosticStateResponse(requestId=get_request_id(request), state=state))
 
 
 @app.post("/api/diagnostic/state/transition", response_model=DiagnosticStateResponse)
@@ -3149,7 +3379,7 @@ def get_history(
     requestId: str | None = Query(default=None),
     request_id: str | None = Query(default=None, alias="request_id"),
     allSessions: bool = Query(default=False),
-) -> HistoryResponse:
+) -> Response:
     safe_limit = min(limit, MAX_HISTORY_LIMIT)
     request_id_filter = (requestId or request_id or "").strip() or None
     include_all_sessions = resolve_effective_include_all_sessions(request, allSessions)
@@ -3170,7 +3400,7 @@ def get_history(
         include_all_sessions=include_all_sessions,
     )
 
-    return HistoryResponse(requestId=get_request_id(request), total=total, items=items)
+    return model_json_response(HistoryResponse(requestId=get_request_id(request), total=total, items=items))
 
 
 @app.get("/api/history/{history_id}", response_model=HistoryDetailResponse)
@@ -3178,7 +3408,7 @@ def get_history_detail(
     history_id: int,
     request: Request,
     allSessions: bool = Query(default=False),
-) -> HistoryDetailResponse:
+) -> Response:
     if history_id < 1:
         raise HTTPException(status_code=400, detail="history_id must be positive")
 
@@ -3194,7 +3424,7 @@ def get_history_detail(
 
     detail = build_history_detail_from_row(row)
 
-    return HistoryDetailResponse(requestId=get_request_id(request), item=detail)
+    return model_json_response(HistoryDetailResponse(requestId=get_request_id(request), item=detail))
 
 
 @app.post("/api/history/cleanup", response_model=HistoryCleanupResponse)
@@ -3280,16 +3510,16 @@ def list_knowledge_endpoint(
     request: Request,
     limit: int = Query(default=20, ge=1),
     source: str | None = Query(default=None),
-) -> KnowledgeListResponse:
+) -> Response:
     rows = list_knowledge_items(limit=limit, source=source)
     items = [format_knowledge_item(row) for row in rows]
-    return KnowledgeListResponse(requestId=get_request_id(request), total=len(items), items=items)
+    return model_json_response(KnowledgeListResponse(requestId=get_request_id(request), total=len(items), items=items))
 
 
 @app.get("/api/rag/config", response_model=RagSearchConfigResponse)
-def get_rag_config_endpoint(request: Request) -> RagSearchConfigResponse:
+def get_rag_config_endpoint(request: Request) -> Response:
     config = get_rag_search_config()
-    return RagSearchConfigResponse(requestId=get_request_id(request), config=format_rag_search_config(config))
+    return model_json_response(RagSearchConfigResponse(requestId=get_request_id(request), config=format_rag_search_config(config)))
 
 
 @app.put("/api/rag/config", response_model=RagSearchConfigResponse)
@@ -3308,11 +3538,11 @@ def search_knowledge_endpoint(
     topK: int | None = Query(default=None, ge=1, le=20),
     limit: int | None = Query(default=None, ge=1, le=20),
     threshold: float | None = Query(default=None, ge=0.0, le=1.0),
-) -> KnowledgeListResponse:
+) -> Response:
     effective_top_k = topK if topK is not None else limit
     rows = search_knowledge_with_configured_retriever(query=query, limit=effective_top_k, threshold=threshold)
     items = [format_knowledge_item(row) for row in rows]
-    return KnowledgeListResponse(requestId=get_request_id(request), total=len(items), items=items)
+    return model_json_response(KnowledgeListResponse(requestId=get_request_id(request), total=len(items), items=items))
 
 
 def _create_interview_session_impl(payload: InterviewCreateRequest, request: Request) -> InterviewCreateResponse:
@@ -3421,16 +3651,16 @@ def list_interview_sessions_endpoint(
     limit: int = Query(default=20, ge=1, le=100),
     status: Literal["active", "paused", "finished"] | None = Query(default=None),
     allSessions: bool = Query(default=False),
-) -> InterviewSessionListResponse:
+) -> Response:
     include_all_sessions = resolve_include_all_sessions(request, allSessions)
-    rows = list_interview_sessions(
+    rows = list_interview_session_summaries(
         limit=limit,
         status=status,
         session_owner_id=get_owner_scope_id(request),
         include_all_sessions=include_all_sessions,
     )
     items = [build_interview_session_payload(row) for row in rows]
-    return InterviewSessionListResponse(requestId=get_request_id(request), total=len(items), items=items)
+    return model_json_response(InterviewSessionListResponse(requestId=get_request_id(request), total=len(items), items=items))
 
 
 @app.get("/api/interview/sessions/{session_id}", response_model=InterviewSessionDetailResponse)
@@ -3438,7 +3668,7 @@ def get_interview_session_detail_endpoint(
     session_id: int,
     request: Request,
     allSessions: bool = Query(default=False),
-) -> InterviewSessionDetailResponse:
+) -> Response:
     if session_id < 1:
         raise HTTPException(status_code=400, detail="session_id must be positive")
 
@@ -3464,12 +3694,13 @@ def get_interview_session_detail_endpoint(
         )
     )
 
-    return InterviewSessionDetailResponse(
+    payload = InterviewSessionDetailResponse(
         requestId=get_request_id(request),
         session=build_interview_session_payload(row),
         nextQuestion=resolve_interview_next_question(row),
         feedbackDraft=parse_interview_feedback(row),
     )
+    return model_json_response(payload)
 
 
 @app.get("/api/interview/results", response_model=InterviewResultListResponse)
@@ -3477,15 +3708,16 @@ def list_interview_results_endpoint(
     request: Request,
     limit: int = Query(default=20, ge=1, le=100),
     allSessions: bool = Query(default=False),
-) -> InterviewResultListResponse:
+) -> Response:
     include_all_sessions = resolve_include_all_sessions(request, allSessions)
-    rows = list_interview_results(
+    rows = list_interview_session_summaries(
         limit=limit,
+        status="finished",
         session_owner_id=get_owner_scope_id(request),
         include_all_sessions=include_all_sessions,
     )
     items = [build_interview_session_payload(row) for row in rows]
-    return InterviewResultListResponse(requestId=get_request_id(request), total=len(items), items=items)
+    return model_json_response(InterviewResultListResponse(requestId=get_request_id(request), total=len(items), items=items))
 
 
 @app.get("/api/interview/results/{session_id}", response_model=InterviewResultDetailResponse)
@@ -3493,7 +3725,7 @@ def get_interview_result_detail_endpoint(
     session_id: int,
     request: Request,
     allSessions: bool = Query(default=False),
-) -> InterviewResultDetailResponse:
+) -> Response:
     if session_id < 1:
         raise HTTPException(status_code=400, detail="session_id must be positive")
 
@@ -3506,11 +3738,12 @@ def get_interview_result_detail_endpoint(
     if row is None:
         raise HTTPException(status_code=404, detail="interview result not found")
 
-    return InterviewResultDetailResponse(
+    payload = InterviewResultDetailResponse(
         requestId=get_request_id(request),
         session=build_interview_session_payload(row),
         feedbackDraft=parse_interview_feedback(row),
     )
+    return model_json_response(payload)
 
 
 @app.post("/api/interview/session/{session_id}/next", response_model=InterviewNextResponse)
@@ -3869,17 +4102,18 @@ def interview_finish_endpoint(session_id: int, request: Request) -> InterviewFin
 def get_resumes(
     request: Request,
     limit: int = Query(default=DEFAULT_RESUME_LIST_LIMIT, ge=1),
-) -> ResumeListResponse:
+) -> Response:
     safe_limit = min(limit, MAX_RESUME_LIST_LIMIT)
     rows = list_resumes(limit=safe_limit, owner_scope_id=get_owner_scope_id(request))
     items = [format_resume_item(row) for row in rows]
     total = count_resumes(owner_scope_id=get_owner_scope_id(request))
 
-    return ResumeListResponse(
+    payload = ResumeListResponse(
         requestId=get_request_id(request),
         total=total,
         items=items,
     )
+    return model_json_response(payload)
 
 
 @app.post("/api/resumes", response_model=ResumeDetailResponse)
@@ -3963,7 +4197,7 @@ def import_resume_txt_endpoint(payload: ResumeTxtImportRequest, request: Request
 
 
 @app.get("/api/resumes/{resume_id}", response_model=ResumeDetailResponse)
-def get_resume_detail_endpoint(resume_id: int, request: Request) -> ResumeDetailResponse:
+def get_resume_detail_endpoint(resume_id: int, request: Request) -> Response:
     if resume_id < 1:
         raise HTTPException(status_code=400, detail="resume_id must be positive")
 
@@ -3971,7 +4205,7 @@ def get_resume_detail_endpoint(resume_id: int, request: Request) -> ResumeDetail
     if row is None:
         raise HTTPException(status_code=404, detail="resume not found")
 
-    return ResumeDetailResponse(requestId=get_request_id(request), item=format_resume_detail(row))
+    return model_json_response(ResumeDetailResponse(requestId=get_request_id(request), item=format_resume_detail(row)))
 
 
 @app.put("/api/resumes/{resume_id}", response_model=ResumeDetailResponse)
@@ -4085,6 +4319,7 @@ def metrics_snapshot(request: Request) -> dict[str, Any]:
     result["ragRetrieverMode"] = get_rag_retriever_mode()
     result["ragSearchConfig"] = format_rag_search_config(get_rag_search_config()).model_dump()
     result["authMode"] = get_auth_mode()
+    result["geminiCache"] = GEMINI_RESPONSE_CACHE.stats()
     return result
 
 
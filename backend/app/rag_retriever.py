@@ -11,7 +11,9 @@ from .rag_store import get_rag_search_config, list_knowledge_items, search_knowl
 
 RetrieverMode = Literal["keyword", "mock-vector"]
 
-STOPWORDS = {
+TOKEN_PATTERN = re.compile(r"[a-zA-Z0-9+#.]{2,}|[\u4e00-\u9fff]{2,}")
+
+STOPWORDS = frozenset({
     "the",
     "and",
     "or",
@@ -51,7 +53,7 @@ STOPWORDS = {
     "工作",
     "岗位",
     "要求",
-}
+})
 
 
 def _get_env_int(name: str, default: int, *, low: int, high: int) -> int:
@@ -98,9 +100,7 @@ class MockVectorKnowledgeRetriever:
     mode: RetrieverMode = "mock-vector"
 
     def _tokenize(self, text: str) -> list[str]:
-        lowered = text.lower()
-        tokens = re.findall(r"[a-zA-Z0-9+#.]{2,}|[\u4e00-\u9fff]{2,}", lowered)
-        return [token for token in tokens if token not in STOPWORDS]
+        return [token for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOPWORDS]
 
     def _counter_norm(self, counter: Counter[str]) -> float:
         return math.sqrt(sum(value * value for value in counter.values()))
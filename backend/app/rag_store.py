@@ -4,8 +4,10 @@ import json
 import re
 import sqlite3
 from collections import Counter
+from contextlib import AbstractContextManager
 from typing import Any
 
+from ._sqlite_pool import pooled_connection
 from .history_store import get_db_path
 
 CREATE_TABLE_SQL = """
@@ -45,7 +47,9 @@ OPTIONAL_COLUMNS: dict[str, str] = {
     "updated_by_scope": "TEXT NOT NULL DEFAULT 'system'",
 }
 
-STOPWORDS = {
+TOKEN_PATTERN = re.compile(r"[a-zA-Z0-9+#.]{2,}|[\u4e00-\u9fff]{2,}")
+
+STOPWORDS = frozenset({
     "the",
     "and",
     "or",
@@ -85,15 +89,11 @@ STOPWORDS = {
     "工作",
     "岗位",
     "要求",
-}
+})
 
 
-def _connect() -> sqlite3.Connection:
-    db_path = get_db_path()
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    return conn
+def _connect() -> AbstractContextManager[sqlite3.Connection]:
+    return pooled_connection(get_db_path(), schema_key="rag_store", ensure_schema=_ensure_schema)
 
 
 def _ensure_optional_columns(conn: sqlite3.Connection) -> None:
@@ -127,9 +127,7 @@ def _json_loads(value: str, *, fallback: Any) -> Any:
 
 
 def _tokenize(text: str) -> list[str]:
-    lowered = text.lower()
-    tokens = re.findall(r"[a-zA-Z0-9+#.]{2,}|[\u4e00-\u9fff]{2,}", lowered)
-    return [token for token in tokens if token not in STOPWORDS]
+    return [token for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOPWORDS]
 
 
 def _score_item(*, query_tokens: list[str], title: str, content: str, tags: list[str]) -> tuple[float, list[str]]:
@@ -195,7 +193,6 @@ def create_knowledge_item(
     safe_updated_by_scope = _normalize_scope(updated_by_scope)
 
     with _connect() as conn:
-        _ensure_schema(conn)
         cursor = conn.execute(
             """
             INSERT INTO knowledge_base_entries (title, content, tags_json, source, updated_by_scope)
@@ -234,7 +231,6 @@ def update_knowledge_item(
     )
 
     with _connect() as conn:
-        _ensure_schema(conn)
         conn.execute(
             """
             UPDATE knowledge_base_entries
@@ -262,7 +258,6 @@ def update_knowledge_item(
 
 def delete_knowledge_item(*, item_id: int) -> bool:
     with _connect() as conn:
-        _ensure_schema(conn)
         affected = conn.execute(
             "DELETE FROM knowledge_base_entries WHERE id = ?",
             (item_id,),
@@ -273,7 +268,6 @@ def delete_knowledge_item(*, item_id: int) -> bool:
 
 def fetch_knowledge_item(*, item_id: int) -> dict[str, Any] | None:
     with _connect() as conn:
-        _ensure_schema(conn)
         row = conn.execute(
             """
             SELECT id, title, content, tags_json, source, created_at, updated_at, updated_by_scope
@@ -310,7 +304,6 @@ def list_knowledge_items(*, limit: int = 20, source: str | None = None) -> list[
         params.append(source_filter)
 
     with _connect() as conn:
-        _ensure_schema(conn)
         rows = conn.execute(
             f"""
             SELECT id, title, content, tags_json, source, created_at, updated_at, updated_by_scope
@@ -351,7 +344,6 @@ def search_knowledge_items(*, query: str, limit: int = 5) -> list[dict[str, Any]
         query_tokens = [safe_query.lower()]
 
     with _connect() as conn:
-        _ensure_schema(conn)
         rows = conn.execute(
             """
             SELECT id, title, content, tags_json, source, created_at, updated_at, updated_by_scope
@@ -397,7 +389,6 @@ def search_knowledge_items(*, query: str, limit: int = 5) -> list[dict[str, Any]
 
 def get_rag_search_config() -> dict[str, Any]:
     with _connect() as conn:
-        _ensure_schema(conn)
         row = conn.execute(
             """
             SELECT top_k, score_threshold, updated_at
@@ -430,7 +421,6 @@ def update_rag_search_config(*, top_k: int | None = None, score_threshold: float
     next_threshold = max(0.0, min(1.0, next_threshold))
 
     with _connect() as conn:
-        _ensure_schema(conn)
         conn.execute(
             """
             UPDATE rag_retriever_settings
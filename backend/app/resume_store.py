@@ -2,8 +2,10 @@ from __future__ import annotations
 
 import json
 import sqlite3
+from contextlib import AbstractContextManager
 from typing import Any
 
+from ._sqlite_pool import pooled_connection
 from .history_store import get_db_path
 
 CREATE_RESUMES_TABLE_SQL = """
@@ -63,13 +65,8 @@ RESUME_VERSION_OPTIONAL_COLUMNS: dict[str, str] = {
 }
 
 
-def _connect() -> sqlite3.Connection:
-    db_path = get_db_path()
-    db_path.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(db_path)
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA foreign_keys = ON")
-    return conn
+def _connect() -> AbstractContextManager[sqlite3.Connection]:
+    return pooled_connection(get_db_path(), schema_key="resume_store", ensure_schema=_ensure_schema)
 
 
 def _ensure_optional_columns(conn: sqlite3.Connection, *, table: str, columns: dict[str, str]) -> None:
@@ -233,7 +230,6 @@ def create_resume(
     )
 
     with _connect() as conn:
-        _ensure_schema(conn)
         cursor = conn.execute(
             """
             INSERT INTO resumes (owner_scope_id, title, latest_version_no, content_updated_at)
@@ -282,7 +278,6 @@ def create_resume(
 def count_resumes(*, owner_scope_id: str | None = None, include_all_users: bool = False) -> int:
     scope_sql, scope_params = _scope_clause_single(owner_scope_id=owner_scope_id, include_all_users=include_all_users)
     with _connect() as conn:
-        _ensure_schema(conn)
         row = conn.execute(
             f"""
             SELECT COUNT(*) AS c
@@ -303,7 +298,6 @@ def list_resumes(*, limit: int = 50, owner_scope_id: str | None = None, include_
     scope_sql, scope_params = _scope_clause(owner_scope_id=owner_scope_id, include_all_users=include_all_users)
 
     with _connect() as conn:
-        _ensure_schema(conn)
         rows = conn.execute(
             f"""
             SELECT
@@ -331,7 +325,6 @@ def list_resumes(*, limit: int = 50, owner_scope_id: str | None = None, include_
 
     items: list[dict[str, Any]] = []
     with _connect() as write_conn:
-        _ensure_schema(write_conn)
         for row in rows:
             latest_version_created_at = str(row["latest_version_created_at"] or row["updated_at"])
             content_updated_at = _resolve_content_updated_at(row=row, fallback=latest_version_created_at)
@@ -366,8 +359,6 @@ def fetch_resume_detail(
 ) -> dict[str, Any] | None:
     scope_sql, scope_params = _scope_clause_single(owner_scope_id=owner_scope_id, include_all_users=include_all_users)
     with _connect() as conn:
-        _ensure_schema(conn)
-
         resume_row = conn.execute(
             f"""
             SELECT
@@ -427,7 +418,6 @@ def fetch_resume_detail(
     content_updated_at = _resolve_content_updated_at(row=resume_row, fallback=content_updated_fallback)
 
     with _connect() as conn:
-        _ensure_schema(conn)
         _backfill_content_updated_at(
             conn,
             resume_id=int(resume_row["id"]),
@@ -457,8 +447,6 @@ def fetch_resume_version_content(
 ) -> dict[str, Any] | None:
     scope_sql, scope_params = _scope_clause_single(owner_scope_id=owner_scope_id, include_all_users=include_all_users)
     with _connect() as conn:
-        _ensure_schema(conn)
-
         resume_row = conn.execute(
             f"""
             SELECT id, latest_version_no
@@ -531,8 +519,6 @@ def update_resume(
     scope_sql, scope_params = _scope_clause_single(owner_scope_id=owner_scope_id, include_all_users=include_all_users)
 
     with _connect() as conn:
-        _ensure_schema(conn)
-
         row = conn.execute(
             f"""
             SELECT id, latest_version_no, content_updated_at
@@ -657,7 +643,6 @@ def delete_resume(
 ) -> bool:
     scope_sql, scope_params = _scope_clause_single(owner_scope_id=owner_scope_id, include_all_users=include_all_users)
     with _connect() as conn:
-        _ensure_schema(conn)
         affected = conn.execute(
             f"""
             UPDATE resumes
@@ -1,15 +1,26 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import sqlite3
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 
 import app.main as main_module
-from app.auth_store import upsert_local_account
+from app.auth_store import create_auth_session, refresh_auth_session, upsert_local_account, validate_auth_session
+from app.history_store import (
+    fetch_analysis_history,
+    get_db_path,
+    insert_analysis_history_batch_json,
+    insert_analysis_history_many,
+    wait_for_pending_retention,
+)
 from app.main import AnalysisInsights, AnalysisResult, ScoreBreakdown, app
 
 client = TestClient(app, raise_server_exceptions=False)
@@ -165,6 +176,56 @@ def test_history_cleanup_keep_latest_and_delete_all() -> None:
     assert delete_resp.json()["total"] == 0
 
 
+def test_analyze_retention_runs_in_background(monkeypatch) -> None:
+    monkeypatch.setattr(main_module, "DEFAULT_HISTORY_RETENTION", 2)
+    for i in range(4):
+        resp = client.post("/api/analyze", json=make_payload(i))
+        assert resp.status_code == 200
+
+    wait_for_pending_retention()
+
+    history_resp = client.get("/api/history")
+    assert history_resp.status_code == 200
+    assert history_resp.json()["total"] == 2
+
+
+def test_insert_analysis_history_many_writes_all_rows() -> None:
+    rows = [
+        {
+            "resume_text_hash_or_excerpt": f"resume-{i}",
+            "jd_excerpt": f"jd-{i}",
+            "score": 60 + i,
+            "score_breakdown": {"keyword_match": 10 + i},
+            "matched_keywords": ["python"],
+            "missing_keywords": ["docker"],
+            "suggestions": [],
+            "optimized_resume": "",
+            "insights": {"summary": "", "strengths": [], "risks": []},
+            "analysis_source": "rule",
+            "session_id": "session-bulk-1",
+            "request_id": f"req-bulk-{i}",
+        }
+        for i in range(3)
+    ]
+
+    assert insert_analysis_history_many(rows) == 3
+    assert insert_analysis_history_many([]) == 0
+
+    items = fetch_analysis_history(limit=10, session_id="session-bulk-1")
+    assert [item["request_id"] for item in items] == ["req-bulk-2", "req-bulk-1", "req-bulk-0"]
+    assert items[0]["score_breakdown"] == {"keyword_match": 12}
+
+    for row in rows:
+        row["session_id"] = "session-bulk-json-1"
+    assert insert_analysis_history_batch_json(json.dumps(rows)) == 3
+
+    json_items = fetch_analysis_history(limit=10, session_id="session-bulk-json-1")
+    assert [item["request_id"] for item in json_items] == ["req-bulk-2", "req-bulk-1", "req-bulk-0"]
+    assert json_items[0]["score_breakdown"] == {"keyword_match": 12}
+    assert json_items[0]["matched_keywords"] == ["python"]
+    assert json_items[0]["user_scope_id"] == "anonymous"
+
+
 def test_export_txt_json_pdf() -> None:
     resp = client.post("/api/analyze", json=make_payload())
     assert resp.status_code == 200
@@ -288,6 +349,50 @@ def test_gemini_success_path(monkeypatch) -> None:
     assert data["score"] == 88
 
 
+def test_gemini_response_cache_skips_repeat_requests(monkeypatch) -> None:
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+    monkeypatch.setattr(main_module, "GEMINI_RESPONSE_CACHE", main_module.LLMResponseCache(max_entries=4))
+    calls: list[str] = []
+
+    def fake_request(*, api_key: str, model: str, prompt: str) -> str:
+        calls.append(prompt)
+        return json.dumps({"score": 77, "matchedKeywords": ["python"], "missingKeywords": ["redis"]})
+
+    monkeypatch.setattr(main_module, "request_gemini_text", fake_request)
+    resume_text = "负责 Python FastAPI 后端开发，优化接口 30%"
+    jd_text = "招聘 Python Redis 后端工程师"
+    seed = main_module.compute_rule_based_analysis(resume_text=resume_text, jd_text=jd_text)
+
+    first = main_module.call_gemini_analysis(resume_text=resume_text, jd_text=jd_text, seed=seed)
+    second = main_module.call_gemini_analysis(resume_text=resume_text, jd_text=jd_text, seed=seed)
+
+    assert first.score == second.score == 77
+    assert len(calls) == 1
+    assert main_module.GEMINI_RESPONSE_CACHE.stats() == {"size": 1, "hits": 1, "misses": 1}
+
+
+def test_request_gemini_text_joins_streamed_sse_chunks(monkeypatch) -> None:
+    events = [
+        {"candidates": [{"content": {"parts": [{"text": '{"score": '}]}}]},
+        {"candidates": [{"content": {"parts": [{"text": '81}'}]}}]},
+        {"usageMetadata": {"totalTokenCount": 12}},
+    ]
+    sse_body = "".join(f"data: {json.dumps(event)}\r\n\r\n" for event in events)
+    seen_requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_requests.append(request)
+        return httpx.Response(200, text=sse_body, headers={"content-type": "text/event-stream"})
+
+    monkeypatch.setattr(main_module, "get_gemini_client", lambda: httpx.Client(transport=httpx.MockTransport(handler)))
+
+    text = main_module.request_gemini_text(api_key="test-key", model="gemini-test", prompt="p")
+
+    assert text == '{"score": 81}'
+    assert seen_requests[0].url.path.endswith("/gemini-test:streamGenerateContent")
+    assert seen_requests[0].url.params["alt"] == "sse"
+
+
 def test_internal_error_shape(monkeypatch) -> None:
     def raise_runtime_error(*_args, **_kwargs):
         raise RuntimeError("boom")
@@ -473,6 +578,15 @@ def test_metrics_snapshot_contains_latency_schema_and_request_id() -> None:
         assert isinstance(entry["p95_ms"], int)
 
 
+def test_metrics_latency_ring_keeps_most_recent_samples() -> None:
+    ring = main_module.LatencyRing(3)
+    for value in (5, 10, 15, 20, 25):
+        ring.append(value)
+
+    assert len(ring) == 3
+    assert sorted(ring) == [15, 20, 25]
+
+
 def test_resume_crud_and_versioning() -> None:
     create_resp = client.post(
         "/api/resumes",
@@ -843,6 +957,114 @@ def test_auth_relogin_refresh_and_session_bound_token(monkeypatch) -> None:
     assert_error_shape(me_after_logout.json(), expected_code="UNAUTHORIZED")
 
 
+def test_auth_login_upgrades_legacy_password_hash() -> None:
+    client.cookies.clear()
+    upsert_local_account(username="legacy", password="legacy123")
+
+    salt = "legacy-salt"
+    legacy_hash = hashlib.pbkdf2_hmac("sha256", b"legacy123", salt.encode("utf-8"), 120_000).hex()
+    with sqlite3.connect(get_db_path()) as conn:
+        conn.execute(
+            "UPDATE local_accounts SET password_hash = ?, password_salt = ? WHERE username = ?",
+            (legacy_hash, salt, "legacy"),
+        )
+
+    login_local_user(
+        username="legacy",
+        password="legacy123",
+        session_id="session-auth-legacy-1",
+        request_id="req-auth-legacy-login-1",
+    )
+
+    with sqlite3.connect(get_db_path()) as conn:
+        stored_hash = conn.execute(
+            "SELECT password_hash FROM local_accounts WHERE username = ?",
+            ("legacy",),
+        ).fetchone()[0]
+    assert stored_hash.startswith("pbkdf2_sha512$")
+
+    login_local_user(
+        username="legacy",
+        password="legacy123",
+        session_id="session-auth-legacy-1",
+        request_id="req-auth-legacy-login-2",
+    )
+
+
+def test_auth_login_rate_limiter_keeps_bounded_failures() -> None:
+    limiter = main_module.AuthLoginRateLimiter(fail_limit=3, window_seconds=60, lock_seconds=60)
+
+    assert limiter.check(key="ip-1").allowed
+    assert limiter.register_failure(key="ip-1").remaining == 2
+    assert limiter.register_failure(key="ip-1").allowed
+    blocked = limiter.register_failure(key="ip-1")
+    assert not blocked.allowed
+    assert not limiter.check(key="ip-1").allowed
+
+    limiter.register_failure(key="ip-1")
+    assert len(limiter._failures["ip-1"]) == 3
+
+    limiter.register_success(key="ip-1")
+    assert limiter.check(key="ip-1").allowed
+    assert "ip-1" not in limiter._failures
+
+
+def test_rate_limiters_sweep_stale_keys(monkeypatch) -> None:
+    clock = [1000.0]
+    monkeypatch.setattr(main_module.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(main_module, "RATE_LIMIT_SWEEP_INTERVAL", 4)
+
+    login_limiter = main_module.AuthLoginRateLimiter(fail_limit=5, window_seconds=60, lock_seconds=60)
+    session_limiter = main_module.SessionRateLimiter(
+        limit=20,
+        window_seconds=60,
+        duplicate_limit=3,
+        duplicate_window_seconds=15,
+    )
+    for i in range(3):
+        login_limiter.register_failure(key=f"ip-stale-{i}")
+        session_limiter.consume(session_id=f"session-stale-{i}", payload_signature="sig")
+
+    clock[0] += 120
+    login_limiter.register_failure(key="ip-live")
+    session_limiter.consume(session_id="session-live", payload_signature="sig")
+
+    assert list(login_limiter._failures) == ["ip-live"]
+    assert list(session_limiter._sessions) == ["session-live"]
+
+
+def test_nonempty_stripped_lines_handles_crlf_and_unicode_separators() -> None:
+    assert main_module.nonempty_stripped_lines("- 负责接口开发\r\n\r\n• 优化查询 30%\r\n") == ("负责接口开发", "优化查询 30%")
+    assert main_module.nonempty_stripped_lines("第一行\u2028第二行") == ("第一行", "第二行")
+
+
+def test_to_excerpt_matches_full_collapse_for_long_and_sparse_text() -> None:
+    assert main_module.to_excerpt("负责  接口\n开发" * 500, limit=10) == "负责 接口 开发负责..."
+    assert main_module.to_excerpt(" " * 100 + "abc   def" + " " * 100, limit=10) == "abc def"
+    assert main_module.to_excerpt(" " * 100 + "abcdefghijkl", limit=10) == "abcdefghij..."
+
+
+def test_concurrent_refresh_of_same_token_only_succeeds_once() -> None:
+    account = upsert_local_account(username="burst", password="burst123")
+    session = create_auth_session(user_id=int(account["id"]), session_id="session-auth-burst-1")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(
+            pool.map(
+                lambda _: refresh_auth_session(token=session["token"], session_id="session-auth-burst-1"),
+                range(8),
+            )
+        )
+
+    reasons = sorted(reason for _, reason in results)
+    assert reasons.count("OK") == 1
+    assert set(reasons) <= {"OK", "TOKEN_REVOKED"}
+
+    refreshed = next(item for item, reason in results if reason == "OK")
+    assert validate_auth_session(token=refreshed["token"], session_id="session-auth-burst-1") is not None
+    assert validate_auth_session(token=session["token"], session_id="session-auth-burst-1") is None
+
+
 def test_authenticated_scope_isolation_for_history_and_interview() -> None:
     client.cookies.clear()
 
@@ -1046,6 +1268,8 @@ def test_interview_summary_result_chain() -> None:
     assert result_item["status"] == "finished"
     assert result_item["summary"] == finish_data["feedbackDraft"]["summary"]
     assert result_item["finalScore"] == finish_data["feedbackDraft"]["overallScore"]
+    assert result_item["questionCount"] == finish_data["session"]["questionCount"]
+    assert result_item["answeredCount"] == finish_data["session"]["answeredCount"]
 
     result_detail_resp = client.get(
         f"/api/interview/results/{session_id}",